@@ -6,9 +6,7 @@ Raw pass-through design for vulnerability research and fuzzing.
 INTENTIONALLY DANGEROUS - Use only in isolated environments.
 """
 
-from .server import CDPBridgeServer
-from .core.cdp_client import CDPClient
-from .core.cdp_pool import CDPConnectionPool, get_global_pool
+from ._lazy import lazy_module
 
 from ._version import __version__
 __author__ = "CDP Ninja Contributors"
@@ -19,4 +17,16 @@ __all__ = [
     'CDPClient',
     'CDPConnectionPool',
     'get_global_pool'
-]
\ No newline at end of file
+]
+
+# Resolved on first access (PEP 562) so `import cdp_ninja.config` and the
+# CLI don't drag in Flask, every route blueprint and the CDP client
+_LAZY_EXPORTS = {
+    'CDPBridgeServer': '.server',
+    'CDPClient': '.core.cdp_client',
+    'CDPConnectionPool': '.core.cdp_pool',
+    'get_global_pool': '.core.cdp_pool',
+}
+
+
+__getattr__, __dir__ = lazy_module(__name__, _LAZY_EXPORTS)
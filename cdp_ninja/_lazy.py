@@ -0,0 +1,34 @@
+"""
+Lazy package re-exports (PEP 562)
+Shared by the package __init__ modules so heavy submodules load on first use
+"""
+
+import importlib
+import sys
+from typing import Callable, Dict, List, Tuple
+
+
+def lazy_module(module_name: str, exports: Dict[str, str]) -> Tuple[Callable[[str], object], Callable[[], List[str]]]:
+    """
+    Build the module-level __getattr__/__dir__ pair for lazy re-exports
+
+    Each name is imported from its submodule on first access and then
+    cached in the package namespace, so later lookups skip __getattr__.
+
+    @param module_name - __name__ of the package re-exporting the names
+    @param exports - Exported name -> relative submodule (e.g. '.cdp_client')
+    @returns (__getattr__, __dir__) to assign at package level
+    """
+    def __getattr__(name: str):
+        submodule = exports.get(name)
+        if submodule is None:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+
+        value = getattr(importlib.import_module(submodule, module_name), name)
+        setattr(sys.modules[module_name], name, value)
+        return value
+
+    def __dir__():
+        return sorted(set(vars(sys.modules[module_name])) | set(exports))
+
+    return __getattr__, __dir__
@@ -5,8 +5,24 @@ User controls their own destiny
 """
 
 import os
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import ClassVar, Optional
+
+
+def _env_int(name: str, default: int):
+    """Read an int env var when the config is built, not at import"""
+    return field(default_factory=lambda: int(os.getenv(name, default)))
+
+
+def _env_bool(name: str, default: str):
+    """Read a 'true'/'false' env var when the config is built, not at import"""
+    return field(default_factory=lambda: os.getenv(name, default).lower() == 'true')
+
+
+def _env_str(name: str, default: str):
+    """Read a string env var when the config is built, not at import"""
+    return field(default_factory=lambda: os.getenv(name, default))
 
 
 @dataclass
@@ -26,59 +42,87 @@ class CDPNinjaConfig:
     """
 
     # Core settings
-    cdp_port: int = int(os.getenv('CDP_PORT', 9222))
-    bridge_port: int = int(os.getenv('BRIDGE_PORT', 8888))
+    cdp_port: int = _env_int('CDP_PORT', 9222)
+    bridge_port: int = _env_int('BRIDGE_PORT', 8888)
 
     # Security toggles (user choice)
-    enable_shell_execution: bool = os.getenv('ENABLE_SHELL_EXECUTION', 'false').lower() == 'true'
+    enable_shell_execution: bool = _env_bool('ENABLE_SHELL_EXECUTION', 'false')
 
     # Performance settings
-    max_events: int = int(os.getenv('MAX_EVENTS', 10000))  # Big buffer for stress testing
-    chrome_timeout: int = int(os.getenv('CHROME_TIMEOUT', 900))  # 15 minutes for pingtrees
+    max_events: int = _env_int('MAX_EVENTS', 10000)  # Big buffer for stress testing
+    chrome_timeout: int = _env_int('CHROME_TIMEOUT', 900)  # 15 minutes for pingtrees
 
     # Network settings
-    bind_host: str = os.getenv('BIND_HOST', '127.0.0.1')  # localhost by default
-    enable_cors: bool = os.getenv('ENABLE_CORS', 'true').lower() == 'true'
+    bind_host: str = _env_str('BIND_HOST', '127.0.0.1')  # localhost by default
+    enable_cors: bool = _env_bool('ENABLE_CORS', 'true')
 
     # Debug settings
-    debug_mode: bool = os.getenv('DEBUG_MODE', 'false').lower() == 'true'
+    debug_mode: bool = _env_bool('DEBUG_MODE', 'false')
+
+    # Banner is shown once per process, however many configs get built
+    _banner_emitted: ClassVar[bool] = False
 
     def __post_init__(self):
         """
         Print warnings for dangerous settings
         But don't prevent anything - user chose this
         """
+        if CDPNinjaConfig._banner_emitted:
+            return
+        CDPNinjaConfig._banner_emitted = True
+
+        lines = []
         if self.enable_shell_execution:
-            print("🚨 WARNING: Shell execution ENABLED")
-            print("   This allows ARBITRARY COMMAND EXECUTION on your system!")
-            print("   Set ENABLE_SHELL_EXECUTION=false to disable")
-            print()
+            lines += [
+                "🚨 WARNING: Shell execution ENABLED",
+                "   This allows ARBITRARY COMMAND EXECUTION on your system!",
+                "   Set ENABLE_SHELL_EXECUTION=false to disable",
+                "",
+            ]
 
         if self.bind_host != '127.0.0.1':
-            print("🌐 WARNING: Binding to non-localhost interface")
-            print(f"   CDP Ninja accessible from network on {self.bind_host}:{self.bridge_port}")
-            print("   Anyone on your network can control your browser!")
-            print()
-
-        print("CDP Ninja Config:")
-        print(f"   CDP Port: {self.cdp_port}")
-        print(f"   Bridge Port: {self.bridge_port}")
-        print(f"   Bind Host: {self.bind_host}")
-        print(f"   Max Events: {self.max_events}")
-        print()
-
-
+            lines += [
+                "🌐 WARNING: Binding to non-localhost interface",
+                f"   CDP Ninja accessible from network on {self.bind_host}:{self.bridge_port}",
+                "   Anyone on your network can control your browser!",
+                "",
+            ]
+
+        lines += [
+            "CDP Ninja Config:",
+            f"   CDP Port: {self.cdp_port}",
+            f"   Bridge Port: {self.bridge_port}",
+            f"   Bind Host: {self.bind_host}",
+            f"   Max Events: {self.max_events}",
+            "",
+        ]
+        # Printed, not logged: the config is built while the server module is
+        # still importing, before logging is configured
+        print("\n".join(lines))
+
+
+@lru_cache(maxsize=None)
 def get_config() -> CDPNinjaConfig:
     """
     Get the current configuration
 
+    Built from the environment on first call and shared afterwards, so
+    runtime toggles (e.g. --shell) are seen everywhere.
+    Call get_config.cache_clear() to re-read the environment.
+
     @returns {CDPNinjaConfig} Current configuration instance
     """
     return CDPNinjaConfig()
 
 
-# Global config instance
-config = CDPNinjaConfig()
+def __getattr__(name: str):
+    """
+    Lazy global config instance - `from cdp_ninja.config import config`
+    no longer reads the environment or prints at import time
+    """
+    if name == 'config':
+        return get_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def print_environment_help():
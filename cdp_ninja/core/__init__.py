@@ -3,8 +3,7 @@ CDP Ninja - Core CDP Client Module
 Chrome DevTools Protocol WebSocket client and event management
 """
 
-from .cdp_client import CDPClient, CDPEvent, CDPDomain, CDPConnection
-from .cdp_pool import CDPConnectionPool, get_global_pool, initialize_global_pool, shutdown_global_pool
+from .._lazy import lazy_module
 
 from .._version import __version__
 __author__ = "CDP Ninja Contributors"
@@ -18,4 +17,20 @@ __all__ = [
     'get_global_pool',
     'initialize_global_pool',
     'shutdown_global_pool'
-]
\ No newline at end of file
+]
+
+# Resolved on first access (PEP 562) so importing one core module doesn't
+# load the websocket client and connection pool alongside it
+_LAZY_EXPORTS = {
+    'CDPClient': '.cdp_client',
+    'CDPEvent': '.cdp_client',
+    'CDPDomain': '.cdp_client',
+    'CDPConnection': '.cdp_client',
+    'CDPConnectionPool': '.cdp_pool',
+    'get_global_pool': '.cdp_pool',
+    'initialize_global_pool': '.cdp_pool',
+    'shutdown_global_pool': '.cdp_pool',
+}
+
+
+__getattr__, __dir__ = lazy_module(__name__, _LAZY_EXPORTS)
@@ -4,23 +4,96 @@ Handles connection, command sending, and event streaming
 """
 
 import asyncio
+import itertools
 import json
+from functools import lru_cache, partial
 import logging
+import selectors
+import socket
+import sys
 import time
-import websocket
+import websocket  # Picks up wsaccel's C UTF-8 validator/XOR masker when installed (cdp-ninja[fast])
 from collections import defaultdict, deque
-from dataclasses import dataclass, asdict
 from datetime import datetime
 from enum import Enum
 from .domain_manager import get_domain_manager, CDPDomain as DomainManagerCDPDomain
 from .event_manager import get_event_manager
 from queue import Queue, Empty, Full
-from threading import Thread, Lock, Event
-from typing import Dict, List, Optional, Any, Callable
+from threading import Thread, Event, Condition, Lock
+from typing import Dict, List, Optional, Any, Callable, Set, Tuple, Union
 import requests
 
-# Set up logging
-logging.basicConfig(level=logging.INFO)
+# orjson is optional - parses CDP frames several times faster than stdlib json.
+# Its dumps() returns UTF-8 bytes, which websocket-client sends as a text frame as-is.
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = partial(orjson.dumps, option=orjson.OPT_NON_STR_KEYS)
+    _CMD_ID, _CMD_PARAMS, _CMD_END = b',"id":%d', b',"params":', b'}'
+except ImportError:
+    _json_loads = json.loads
+    _json_dumps = json.dumps
+    _CMD_ID, _CMD_PARAMS, _CMD_END = ',"id":%d', ',"params":', '}'
+
+# Kernel receive buffer for the DevTools socket - large enough to absorb a
+# burst of Network events or a multi-MB getResponseBody between reads
+_WS_RECV_BUFFER = 4 * 1024 * 1024
+
+# Shared keep-alive session for Chrome's /json endpoint - reconnects and
+# connection tests reuse one pooled TCP connection instead of opening a new one
+_http_session = requests.Session()
+
+# Chrome serializes events with "method" as the first key, so the method
+# (and therefore the domain) can be read off the raw frame without parsing it
+_EVENT_PREFIX = '{"method":"'
+_EVENT_PREFIX_LEN = len(_EVENT_PREFIX)
+
+# Interned method name -> (method, domain). CDP has a few hundred event names,
+# so this stays small; a hit skips the intern and partition entirely
+_DOMAIN_CACHE: Dict[str, Tuple[str, str]] = {}
+
+# Serializes CDPEvent's lazy decode - handler and request threads can read the
+# same event at once, and only one of them may parse it. Shared rather than
+# per event since decodes are rare next to the number of buffered events.
+_DECODE_LOCK = Lock()
+
+
+def _method_and_domain(method: str) -> Tuple[str, str]:
+    """
+    Interned method name and its domain ('Network.dataReceived' -> 'Network')
+
+    Interned so per-domain/handler dict lookups hit the cached hash and the
+    thousands of buffered events share one string per method.
+    """
+    cached = _DOMAIN_CACHE.get(method)
+    if cached is None:
+        method = sys.intern(method)
+        domain, dot, _ = method.partition('.')
+        cached = _DOMAIN_CACHE.setdefault(method, (method, sys.intern(domain) if dot else 'Unknown'))
+    return cached
+
+
+@lru_cache(maxsize=512)
+def _command_head(method: str) -> Union[str, bytes]:
+    """Pre-encoded '{"method":"<method>"' prefix, shared by every command to that method"""
+    return _json_dumps({"method": method})[:-1]
+
+
+def _encode_command(cmd_id: int, method: str, params: Optional[dict]) -> Union[str, bytes]:
+    """
+    Encode a CDP command frame
+
+    Only params (if any) go through the JSON encoder; the method prefix is
+    cached per method and the id is formatted straight in, so the common
+    parameterless command (Domain.enable etc.) never builds a dict at all.
+    """
+    message = _command_head(method) + _CMD_ID % cmd_id
+    if params:
+        message += _CMD_PARAMS + _json_dumps(params)
+    return message + _CMD_END
+
+
+# Logging is configured by the application (server.py / CLI), not on import
 logger = logging.getLogger(__name__)
 
 
@@ -39,20 +112,33 @@ class CDPDomain(Enum):
     MEMORY = "Memory"
 
 
-@dataclass
 class CDPEvent:
-    """Structured CDP Event"""
-    method: str
-    params: Dict[str, Any]
-    domain: str
-    timestamp: float
-    session_id: Optional[str] = None
+    """
+    Structured CDP Event - slotted, since thousands are buffered at once
+
+    Events built by from_message keep the raw frame and only parse it when
+    params/session_id are first read; most buffered events are evicted from
+    their ring without anyone ever looking at them.
+    """
+
+    __slots__ = ('method', 'domain', 'timestamp', '_params', '_session_id', '_raw')
+
+    def __init__(self, method: str, params: Dict[str, Any], domain: str,
+                 timestamp: float, session_id: Optional[str] = None):
+        self.method = method
+        self.domain = domain
+        self.timestamp = timestamp
+        self._params = params
+        self._session_id = session_id
+        self._raw = None
+
+    def __repr__(self):
+        return f"CDPEvent(method={self.method!r}, domain={self.domain!r}, timestamp={self.timestamp!r})"
 
     @classmethod
     def from_raw(cls, data: dict):
         """Create CDPEvent from raw WebSocket message"""
-        method = data.get('method', '')
-        domain = method.split('.')[0] if '.' in method else 'Unknown'
+        method, domain = _method_and_domain(data.get('method', ''))
         return cls(
             method=method,
             params=data.get('params', {}),
@@ -61,9 +147,65 @@ class CDPEvent:
             session_id=data.get('sessionId')
         )
 
+    @classmethod
+    def from_message(cls, method: str, domain: str, message: str):
+        """Create CDPEvent around an unparsed frame whose method is already known"""
+        event = cls(method, None, domain, time.time())
+        event._raw = message
+        return event
+
+    def _decode(self):
+        """Parse the raw frame into params/session_id (once, even across threads)"""
+        with _DECODE_LOCK:
+            raw = self._raw
+            if raw is None:
+                return
+
+            try:
+                data = _json_loads(raw)
+            except ValueError as e:
+                logger.error("Invalid JSON in %s event: %s", self.method, e)
+                data = {}
+
+            # Publish the fields before clearing _raw so lock-free readers
+            # that see _raw is None also see the parsed values
+            self._params = data.get('params', {})
+            self._session_id = data.get('sessionId')
+            self._raw = None
+
+    @property
+    def params(self) -> Dict[str, Any]:
+        """Event parameters, parsed from the raw frame on first access"""
+        if self._raw is not None:
+            self._decode()
+        return self._params
+
+    @params.setter
+    def params(self, value: Dict[str, Any]):
+        self._decode()
+        self._params = value
+
+    @property
+    def session_id(self) -> Optional[str]:
+        """Target session id, parsed from the raw frame on first access"""
+        if self._raw is not None:
+            self._decode()
+        return self._session_id
+
+    @session_id.setter
+    def session_id(self, value: Optional[str]):
+        self._decode()
+        self._session_id = value
+
     def to_dict(self):
         """Convert to dictionary for JSON serialization"""
-        return asdict(self)
+        return {
+            'method': self.method,
+            'params': self.params,
+            'domain': self.domain,
+            'timestamp': self.timestamp,
+            'session_id': self.session_id
+        }
 
 
 class CDPConnection:
@@ -78,10 +220,18 @@ class CDPConnection:
         self._reconnect_attempts = 0
         self._max_reconnect = 5
 
+        # receive() waits in select() on the WebSocket plus a wake-up socket
+        # pair, so disconnect() can interrupt a waiting listener immediately
+        # and the socket timeout never has to be re-set per call. The pair is
+        # opened by connect(), survives reconnects and is released by close()
+        self._selector: Optional[selectors.BaseSelector] = None
+        self._wake_recv: Optional[socket.socket] = None
+        self._wake_send: Optional[socket.socket] = None
+
     def get_debugger_url(self) -> Optional[str]:
         """Fetch WebSocket URL from Chrome /json endpoint"""
         try:
-            response = requests.get(
+            response = _http_session.get(
                 f"http://{self.host}:{self.port}/json",
                 timeout=30  # Increased timeout for Windows
             )
@@ -122,10 +272,29 @@ class CDPConnection:
                 logger.error("No Chrome WebSocket URL available")
                 return False
 
-            self.ws = websocket.WebSocket()
+            # enable_multithread: send_command is called from many Flask threads at
+            # once with no client-side lock, so websocket-client must serialize
+            # frame writes itself. Chrome's frames are valid UTF-8 and json.loads
+            # rejects anything that isn't, so the per-frame UTF-8 pass is skipped.
+            # TCP_NODELAY is already in websocket-client's default socket options.
+            self.ws = websocket.WebSocket(
+                enable_multithread=True,
+                skip_utf8_validation=True,
+                sockopt=((socket.SOL_SOCKET, socket.SO_RCVBUF, _WS_RECV_BUFFER),)
+            )
             self.ws.settimeout(10)
             self.ws.connect(self.url)
 
+            if self._wake_recv is None:
+                self._wake_recv, self._wake_send = socket.socketpair()
+                self._wake_recv.setblocking(False)
+                self._wake_send.setblocking(False)
+
+            self._close_selector()
+            self._selector = selectors.DefaultSelector()
+            self._selector.register(self.ws.sock, selectors.EVENT_READ)
+            self._selector.register(self._wake_recv, selectors.EVENT_READ)
+
             self.connected.set()
             self._reconnect_attempts = 0
             logger.info(f"Connected to Chrome DevTools: {self.url}")
@@ -156,17 +325,61 @@ class CDPConnection:
     def disconnect(self):
         """Close WebSocket connection"""
         if self.ws:
+            self.connected.clear()
+            self.wake()
+            self._close_selector()
             try:
                 self.ws.close()
             except Exception as e:
                 logger.debug(f"Error closing WebSocket: {e}")
                 pass
-            self.connected.clear()
             self.ws = None
             logger.info("Disconnected from Chrome DevTools")
 
-    def send(self, message: str) -> bool:
-        """Send message to Chrome DevTools"""
+    def close(self):
+        """Disconnect and release the wake-up sockets (final teardown; connect() reopens them)"""
+        self.disconnect()
+        wake_recv, wake_send = self._wake_recv, self._wake_send
+        self._wake_recv = self._wake_send = None
+        for sock in (wake_recv, wake_send):
+            if sock is not None:
+                sock.close()
+
+    def wake(self):
+        """Interrupt a receive() that is waiting for data"""
+        wake_send = self._wake_send
+        if wake_send is None:
+            return
+        try:
+            wake_send.send(b'\0')
+        except OSError:
+            pass  # Buffer full (a wake-up is already pending) or already closed
+
+    def _drain_wake(self):
+        """Consume pending wake-up bytes"""
+        try:
+            while self._wake_recv.recv(64):
+                pass
+        except (BlockingIOError, OSError):
+            pass
+
+    def _close_selector(self):
+        """Release the selector of the previous connection, if any"""
+        if self._selector is not None:
+            self._selector.close()
+            self._selector = None
+
+    def _has_buffered_data(self, ws: websocket.WebSocket) -> bool:
+        """True if a frame is already (partly) read but not yet returned"""
+        frame_buffer = getattr(ws, 'frame_buffer', None)
+        if frame_buffer is not None and getattr(frame_buffer, 'recv_buffer', None):
+            return True
+        # TLS sockets can hold decrypted bytes that select() can't see
+        pending = getattr(ws.sock, 'pending', None)
+        return bool(pending and pending())
+
+    def send(self, message: Union[str, bytes]) -> bool:
+        """Send message (str or UTF-8 bytes) to Chrome DevTools as a text frame"""
         if not self.connected.is_set() or not self.ws:
             return False
 
@@ -180,12 +393,22 @@ class CDPConnection:
 
     def receive(self, timeout: float = 1.0) -> Optional[str]:
         """Receive message from Chrome DevTools"""
-        if not self.connected.is_set() or not self.ws:
+        ws = self.ws
+        if not self.connected.is_set() or not ws:
             return None
 
         try:
-            self.ws.settimeout(timeout)
-            message = self.ws.recv()
+            selector = self._selector
+            if selector is not None and not self._has_buffered_data(ws):
+                ready = selector.select(timeout)
+                if not ready:
+                    return None
+                if any(key.fileobj is self._wake_recv for key, _ in ready):
+                    self._drain_wake()
+                    if len(ready) == 1 or not self.connected.is_set():
+                        return None
+
+            message = ws.recv()
             return message
         except websocket.WebSocketTimeoutException:
             return None
@@ -194,6 +417,8 @@ class CDPConnection:
             self.connected.clear()
             return None
         except Exception as e:
+            if not self.connected.is_set():
+                return None  # Torn down by disconnect() while we were waiting
             logger.error(f"Error receiving message: {e}")
             return None
 
@@ -217,14 +442,26 @@ class CDPClient:
         # No longer store events locally - all events go through centralized EventManager
 
         # Command tracking
-        self.command_id = 1
-        self.pending_commands: Dict[int, dict] = {}
-        self.command_lock = Lock()
+        # Ids come from itertools.count (atomic under the GIL). In-flight ids and
+        # their responses share one Condition instead of an Event per command;
+        # callers wait_for their own id to show up in _responses
+        self._command_ids = itertools.count(1)
+        self.pending_commands: Set[int] = set()
+        self._responses: Dict[int, dict] = {}
+        self._response_cond = Condition()
 
         # Background thread for receiving messages
         self.listener_thread: Optional[Thread] = None
         self.running = False
 
+        # Frames are parsed and dispatched on a separate decoder thread so a
+        # slow handler doesn't hold up the socket read. Events and command
+        # responses share one FIFO backlog: a response is only resolved after
+        # every event Chrome sent before it has been stored. The backlog is
+        # bounded by max_events; when full, the listener waits rather than drop
+        self.decoder_thread: Optional[Thread] = None
+        self._message_backlog: Queue = Queue(maxsize=max_events)
+
     def start(self) -> bool:
         """Initialize connection and start listening"""
         logger.info("Starting CDP client...")
@@ -234,6 +471,8 @@ class CDPClient:
             return False
 
         self.running = True
+        self.decoder_thread = Thread(target=self._decode_loop, daemon=True)
+        self.decoder_thread.start()
         self.listener_thread = Thread(target=self._listen_loop, daemon=True)
         self.listener_thread.start()
 
@@ -255,6 +494,17 @@ class CDPClient:
         if self.listener_thread and self.listener_thread.is_alive():
             self.listener_thread.join(timeout=5)
 
+        if self.connection:
+            # The listener is gone, so its wake-up sockets can be released too
+            self.connection.close()
+
+        if self.decoder_thread and self.decoder_thread.is_alive():
+            try:
+                self._message_backlog.put_nowait(None)  # Wake the decoder
+            except Full:
+                pass
+            self.decoder_thread.join(timeout=5)
+
         logger.info("CDP client stopped")
 
     def _listen_loop(self):
@@ -277,19 +527,56 @@ class CDPClient:
 
                 message = self.connection.receive(timeout=0.5)
                 if message:
-                    self._process_message(message)
+                    self._enqueue_message(message)
 
             except Exception as e:
                 logger.error(f"Error in listen loop: {e}")
 
         logger.info("CDP message listener stopped")
 
+    def _enqueue_message(self, message: str):
+        """Hand a frame to the decoder thread, waiting while the backlog is full"""
+        while self.running:
+            try:
+                self._message_backlog.put(message, timeout=0.5)
+                return
+            except Full:
+                continue
+
+    def _decode_loop(self):
+        """Background thread to process queued CDP messages in arrival order"""
+        while self.running:
+            try:
+                message = self._message_backlog.get(timeout=0.5)
+            except Empty:
+                continue
+
+            if message is None:
+                break
+
+            try:
+                self._process_message(message)
+            except Exception as e:
+                logger.error("Error processing CDP message: %s", e)
+
+        logger.info("CDP event decoder stopped")
+
     def _process_message(self, message: str):
         """Route CDP message to appropriate handler"""
+        if message.startswith(_EVENT_PREFIX):
+            # Event fast path: route on the method alone, never parse here
+            end = message.find('"', _EVENT_PREFIX_LEN)
+            if end != -1:
+                method, domain = _method_and_domain(message[_EVENT_PREFIX_LEN:end])
+                # Buffer the frame as-is; params are parsed on first access and
+                # store_event drops disabled domains, so nothing is parsed for them
+                self._handle_event(CDPEvent.from_message(method, domain, message))
+                return
+
         try:
-            data = json.loads(message)
-        except json.JSONDecodeError as e:
-            logger.error(f"Invalid JSON received: {e}")
+            data = _json_loads(message)
+        except ValueError as e:
+            logger.error("Invalid JSON received: %s", e)
             return
 
         if 'id' in data:
@@ -303,10 +590,12 @@ class CDPClient:
     def _handle_command_response(self, data: dict):
         """Handle response to a command we sent"""
         cmd_id = data['id']
-        with self.command_lock:
+        with self._response_cond:
+            # A caller that already timed out has removed its id - drop the late reply
             if cmd_id in self.pending_commands:
-                self.pending_commands[cmd_id]['response'] = data
-                self.pending_commands[cmd_id]['event'].set()
+                self.pending_commands.discard(cmd_id)
+                self._responses[cmd_id] = data
+                self._response_cond.notify_all()
 
     def _handle_event(self, event: CDPEvent):
         """Process and distribute CDP events via centralized EventManager"""
@@ -315,7 +604,7 @@ class CDPClient:
             # Store event in centralized manager (handles domain filtering, storage, and handlers)
             event_manager.store_event(event)
         else:
-            logger.warning(f"No EventManager available, dropping event: {event.method}")
+            logger.warning("No EventManager available, dropping event: %s", event.method)
 
     def send_command(self, method: str, params: Optional[dict] = None,
                     timeout: Optional[float] = None) -> dict:
@@ -327,55 +616,101 @@ class CDPClient:
         if timeout is None:
             timeout = self.default_timeout
 
-        with self.command_lock:
-            cmd_id = self.command_id
-            self.command_id += 1
-
-            command = {
-                "id": cmd_id,
-                "method": method
-            }
-            if params:
-                command["params"] = params
-
-            response_event = Event()
-            self.pending_commands[cmd_id] = {
-                "command": command,
-                "response": None,
-                "event": response_event
-            }
+        cmd_id, message = self._register_command(method, params)
 
         try:
             # Send command
-            message = json.dumps(command)
-            logger.debug(f"Sending to Chrome: {message}")
-            if not self.connection.send(message):
-                with self.command_lock:
-                    if cmd_id in self.pending_commands:
-                        del self.pending_commands[cmd_id]
+            if not self._send_registered(cmd_id, message):
                 return {"error": "Failed to send command"}
 
             # Wait for response
-            if response_event.wait(timeout):
-                with self.command_lock:
-                    response = self.pending_commands[cmd_id]['response']
-                    del self.pending_commands[cmd_id]
-
-                if 'error' in response:
-                    logger.warning(f"CDP command error: {method} - {response['error']}")
-
-                return response
-            else:
-                # Timeout
-                with self.command_lock:
-                    if cmd_id in self.pending_commands:
-                        del self.pending_commands[cmd_id]
-                return {"error": f"Command timeout after {timeout}s"}
+            return self._await_response(cmd_id, method, timeout)
 
         except Exception as e:
+            self._discard_command(cmd_id)
             logger.error(f"Error sending command {method}: {e}")
             return {"error": str(e)}
 
+    def send_commands_batch(self, commands: List[Tuple[str, Optional[dict]]],
+                            timeout: Optional[float] = None) -> List[dict]:
+        """
+        Send several CDP commands back-to-back, then wait for all responses
+
+        CDP has no array/batch message, so every command is still its own
+        frame - but all frames are written before the first wait, turning
+        N sequential round-trips into roughly one. Responses may arrive in
+        any order; they are returned in the order of ``commands``, and the
+        timeout is a single deadline shared by the whole batch.
+        """
+        if not self.connection.connected.is_set():
+            return [{"error": "Not connected to Chrome DevTools"} for _ in commands]
+
+        # Use default timeout if none provided
+        if timeout is None:
+            timeout = self.default_timeout
+
+        batch = [(method,) + self._register_command(method, params) for method, params in commands]
+
+        results: List[Optional[dict]] = [None] * len(batch)
+        try:
+            # Write every frame before waiting on any response
+            for index, (method, cmd_id, message) in enumerate(batch):
+                if not self._send_registered(cmd_id, message):
+                    results[index] = {"error": "Failed to send command"}
+
+            deadline = time.monotonic() + timeout
+            for index, (method, cmd_id, _) in enumerate(batch):
+                if results[index] is None:
+                    remaining = max(0.0, deadline - time.monotonic())
+                    results[index] = self._await_response(cmd_id, method, remaining, timeout)
+
+        except Exception as e:
+            logger.error(f"Error sending command batch: {e}")
+            for index, (_, cmd_id, _) in enumerate(batch):
+                self._discard_command(cmd_id)
+                if results[index] is None:
+                    results[index] = {"error": str(e)}
+
+        return results
+
+    def _register_command(self, method: str, params: Optional[dict]) -> Tuple[int, Union[str, bytes]]:
+        """Allocate a command id, encode the command and register it as pending"""
+        cmd_id = next(self._command_ids)
+        message = _encode_command(cmd_id, method, params)
+
+        with self._response_cond:
+            self.pending_commands.add(cmd_id)
+
+        return cmd_id, message
+
+    def _send_registered(self, cmd_id: int, message: Union[str, bytes]) -> bool:
+        """Send an encoded, registered command, unregistering it on failure"""
+        logger.debug("Sending to Chrome: %s", message)
+        if not self.connection.send(message):
+            self._discard_command(cmd_id)
+            return False
+        return True
+
+    def _await_response(self, cmd_id: int, method: str, wait: float,
+                        timeout: Optional[float] = None) -> dict:
+        """Wait for a registered command's response (the listener unregisters it)"""
+        with self._response_cond:
+            if not self._response_cond.wait_for(lambda: cmd_id in self._responses, wait):
+                self.pending_commands.discard(cmd_id)
+                return {"error": f"Command timeout after {timeout if timeout is not None else wait}s"}
+            response = self._responses.pop(cmd_id)
+
+        if 'error' in response:
+            logger.warning(f"CDP command error: {method} - {response['error']}")
+
+        return response
+
+    def _discard_command(self, cmd_id: int):
+        """Forget a pending command (send failure, timeout or error)"""
+        with self._response_cond:
+            self.pending_commands.discard(cmd_id)
+            self._responses.pop(cmd_id, None)
+
     def _enable_default_domains(self) -> bool:
         """Enable essential CDP domains using domain manager"""
         domain_manager = get_domain_manager()
@@ -390,7 +725,12 @@ class CDPClient:
         return domain_manager.enable_default_domains()
 
     def register_event_handler(self, method: str, handler: Callable[[CDPEvent], None]):
-        """Register callback for specific CDP event"""
+        """
+        Register callback for specific CDP event
+
+        Handlers are invoked on the client's decoder thread, not the thread
+        that registered them; keep them short and thread-safe.
+        """
         event_manager = get_event_manager()
         if event_manager:
             event_manager.register_event_handler(method, handler)
@@ -445,7 +785,7 @@ def create_cdp_client(port: int = 9222, auto_start: bool = True) -> CDPClient:
 def test_chrome_connection(port: int = 9222) -> bool:
     """Test if Chrome DevTools is accessible on given port"""
     try:
-        response = requests.get(f"http://localhost:{port}/json", timeout=2)
+        response = _http_session.get(f"http://localhost:{port}/json", timeout=2)
         tabs = response.json()
         return len(tabs) > 0
     except (requests.RequestException, ValueError, KeyError) as e:
@@ -455,6 +795,7 @@ def test_chrome_connection(port: int = 9222) -> bool:
 
 if __name__ == "__main__":
     # Simple test of CDP client
+    logging.basicConfig(level=logging.INFO)
     print("Testing CDP Client...")
 
     if not test_chrome_connection():
@@ -5,10 +5,9 @@ Provides intelligent domain loading with stealth-conscious configuration
 
 import logging
 import time
-from dataclasses import dataclass
 from enum import Enum
-from typing import Dict, Set, List, Optional, Callable
-from threading import Lock
+from typing import Any, Dict, FrozenSet, Set, List, Optional, Callable, Tuple
+from threading import Lock, RLock
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +34,13 @@ class CDPDomain(Enum):
     MEMORY = "Memory"                   # High stealth risk
 
 
+# Prebuilt "<Domain>.enable"/"<Domain>.disable" method names
+for _domain in CDPDomain:
+    _domain.enable_cmd = f"{_domain.value}.enable"
+    _domain.disable_cmd = f"{_domain.value}.disable"
+del _domain
+
+
 class DomainRiskLevel(Enum):
     """Stealth risk assessment for domains"""
     SAFE = "safe"           # Stealth-tested, no detection risk
@@ -44,37 +50,61 @@ class DomainRiskLevel(Enum):
     VERY_HIGH = "very_high" # Maximum detection risk
 
 
-@dataclass
+# Ordinal per risk level (SAFE=0 .. VERY_HIGH=4) for cheap threshold checks;
+# .value stays the string that status output and the CLI display
+for _order, _level in enumerate(DomainRiskLevel):
+    _level.order = _order
+del _order, _level
+
+
 class DomainConfig:
     """Configuration for a CDP domain"""
-    domain: CDPDomain
-    risk_level: DomainRiskLevel
-    requires_enable: bool = True
-    dependencies: List[CDPDomain] = None
-    auto_unload_timeout: Optional[int] = None  # Minutes until auto-unload
 
-    def __post_init__(self):
-        if self.dependencies is None:
-            self.dependencies = []
+    __slots__ = ('domain', 'risk_level', 'requires_enable', 'dependencies', 'auto_unload_timeout')
+
+    def __init__(self, domain: CDPDomain, risk_level: DomainRiskLevel,
+                 requires_enable: bool = True, dependencies: List[CDPDomain] = None,
+                 auto_unload_timeout: Optional[int] = None):
+        self.domain = domain
+        self.risk_level = risk_level
+        self.requires_enable = requires_enable
+        self.dependencies = dependencies if dependencies is not None else []
+        self.auto_unload_timeout = auto_unload_timeout  # Minutes until auto-unload
+
+    def __repr__(self):
+        return (f"DomainConfig(domain={self.domain!r}, risk_level={self.risk_level!r}, "
+                f"requires_enable={self.requires_enable!r}, dependencies={self.dependencies!r}, "
+                f"auto_unload_timeout={self.auto_unload_timeout!r})")
 
 
-@dataclass
 class DomainState:
-    """Runtime state of a CDP domain"""
-    enabled: bool = False
-    last_used: float = 0
-    enable_count: int = 0
-    last_error: Optional[str] = None
-    enabled_by: Set[str] = None
+    """Runtime state of a CDP domain - slotted, read on every ensure_domain call"""
+
+    __slots__ = ('enabled', 'last_used', 'enable_count', 'last_error', 'enabled_by', 'config')
+
+    def __init__(self, enabled: bool = False, last_used: float = 0, enable_count: int = 0,
+                 last_error: Optional[str] = None, enabled_by: Set[str] = None,
+                 config: Optional[DomainConfig] = None):
+        self.enabled = enabled
+        self.last_used = last_used
+        self.enable_count = enable_count
+        self.last_error = last_error
+        self.enabled_by = enabled_by if enabled_by is not None else set()
+        self.config = config  # Static config, bound once at init
 
-    def __post_init__(self):
-        if self.enabled_by is None:
-            self.enabled_by = set()
+    def __repr__(self):
+        return (f"DomainState(enabled={self.enabled!r}, last_used={self.last_used!r}, "
+                f"enable_count={self.enable_count!r}, last_error={self.last_error!r}, "
+                f"enabled_by={self.enabled_by!r})")
 
 
 class DomainManager:
     """Intelligent CDP domain lifecycle management"""
 
+    # last_used only feeds minute-scale auto-unload timeouts, so it is
+    # refreshed at most once per this many seconds
+    USAGE_UPDATE_GRANULARITY = 1.0
+
     # Domain configurations with risk assessments
     DOMAIN_CONFIGS = {
         # Stealth-safe domains (proven)
@@ -109,14 +139,37 @@ class DomainManager:
         self.max_risk_level = max_risk_level
         self.domain_states: Dict[CDPDomain, DomainState] = {}
         self.cdp_client = None  # Set by pool when needed
-        self._lock = Lock()
+        # Re-entrant: _enable_domains_batch calls ensure_domain while holding it
+        self._lock = RLock()
         self.enabled_domains: Set[CDPDomain] = set()
+        # Mirror of enabled_domains by name, for the per-event check in EventManager
+        self.enabled_domain_values: Set[str] = set()
         self.auto_unload_enabled = True  # Can be disabled via CLI
         self.default_timeout_minutes = 15  # Default timeout for domains
 
         # Initialize domain states
         for domain in CDPDomain:
-            self.domain_states[domain] = DomainState()
+            self.domain_states[domain] = DomainState(config=self.DOMAIN_CONFIGS.get(domain))
+
+        # Domains allowed at each risk level, and the set for the current one
+        # (swapped by set_risk_level)
+        self._allowed_by_risk: Dict[DomainRiskLevel, FrozenSet[CDPDomain]] = {
+            level: frozenset(domain for domain, config in self.DOMAIN_CONFIGS.items()
+                             if config.risk_level.order <= level.order)
+            for level in DomainRiskLevel
+        }
+        self._risk_allowed = self._allowed_by_risk[max_risk_level]
+
+        # Transitive dependencies per domain, deepest first, so ensure_domain
+        # can enable them with a flat loop
+        self._dep_closure: Dict[CDPDomain, Tuple[CDPDomain, ...]] = {
+            domain: self._dependency_closure(domain) for domain in CDPDomain
+        }
+
+        # Bumped on every change get_domain_status reports (except last_used,
+        # which is refreshed per call); keys the (version, status) cache
+        self._state_version = 0
+        self._status_cache: Optional[Tuple[int, Dict[str, Any]]] = None
 
     def set_cdp_client(self, cdp_client):
         """Set CDP client for domain operations"""
@@ -124,18 +177,33 @@ class DomainManager:
 
     def can_enable_domain(self, domain: CDPDomain) -> bool:
         """Check if domain can be enabled based on risk settings"""
-        config = self.DOMAIN_CONFIGS.get(domain)
-        if not config:
-            return False
-
-        # Check risk level
-        risk_levels = [DomainRiskLevel.SAFE, DomainRiskLevel.LOW, DomainRiskLevel.MEDIUM,
-                      DomainRiskLevel.HIGH, DomainRiskLevel.VERY_HIGH]
+        return domain in self._risk_allowed
 
-        max_index = risk_levels.index(self.max_risk_level)
-        domain_index = risk_levels.index(config.risk_level)
+    def _dependency_closure(self, domain: CDPDomain) -> Tuple[CDPDomain, ...]:
+        """
+        Resolve a domain's transitive dependencies without recursion
 
-        return domain_index <= max_index
+        @param domain - Domain whose dependencies to resolve
+        @returns Dependencies in enable order (each after its own dependencies)
+        """
+        def deps_of(d: CDPDomain) -> List[CDPDomain]:
+            config = self.DOMAIN_CONFIGS.get(d)
+            return config.dependencies if config else []
+
+        closure: List[CDPDomain] = []
+        seen = {domain}
+        stack = [(domain, iter(deps_of(domain)))]
+        while stack:
+            node, remaining = stack[-1]
+            dep = next(remaining, None)
+            if dep is None:
+                stack.pop()
+                if node is not domain:
+                    closure.append(node)
+            elif dep not in seen:
+                seen.add(dep)
+                stack.append((dep, iter(deps_of(dep))))
+        return tuple(closure)
 
     def ensure_domain(self, domain: CDPDomain, caller: str = "unknown") -> bool:
         """
@@ -145,9 +213,17 @@ class DomainManager:
         @param caller - Identifier of the caller (for tracking)
         @returns True if domain is available
         """
+        # Fast path, no lock and read-only: already enabled for this caller
+        # and used within the last USAGE_UPDATE_GRANULARITY seconds is by far
+        # the common case. Anything that needs a write goes through the lock.
+        state = self.domain_states[domain]
+        if (state.enabled and caller in state.enabled_by
+                and time.time() - state.last_used < self.USAGE_UPDATE_GRANULARITY):
+            return True
+
         with self._lock:
-            # Check if already enabled
-            if self.domain_states[domain].enabled:
+            # Re-check under the lock - another thread may have enabled it
+            if state.enabled:
                 self._update_domain_usage(domain, caller)
                 return True
 
@@ -157,57 +233,127 @@ class DomainManager:
                 return False
 
             # Enable dependencies first
-            config = self.DOMAIN_CONFIGS.get(domain)
-            if config and config.dependencies:
-                for dep_domain in config.dependencies:
-                    if not self.ensure_domain(dep_domain, f"{caller}:dep"):
-                        logger.error(f"Failed to enable dependency {dep_domain.value} for {domain.value}")
-                        return False
+            dep_caller = f"{caller}:dep"
+            for dep_domain in self._dep_closure[domain]:
+                if self.domain_states[dep_domain].enabled:
+                    self._update_domain_usage(dep_domain, dep_caller)
+                elif not self.can_enable_domain(dep_domain) or not self._enable_domain(dep_domain, dep_caller):
+                    logger.error(f"Failed to enable dependency {dep_domain.value} for {domain.value}")
+                    return False
 
             # Enable the domain
             return self._enable_domain(domain, caller)
 
     def _enable_domain(self, domain: CDPDomain, caller: str) -> bool:
         """Internal domain enabling logic"""
-        config = self.DOMAIN_CONFIGS.get(domain)
+        state = self.domain_states[domain]
+        config = state.config
         if not config:
             logger.error(f"Unknown domain: {domain.value}")
             return False
 
-        state = self.domain_states[domain]
-
         try:
             # Enable domain if required
             if config.requires_enable and self.cdp_client:
-                result = self.cdp_client.send_command(f"{domain.value}.enable", timeout=10)
+                result = self.cdp_client.send_command(domain.enable_cmd, timeout=10)
 
                 if 'error' in result:
                     error_msg = result.get('error', 'Unknown error')
                     logger.warning(f"Failed to enable {domain.value}: {error_msg}")
                     state.last_error = error_msg
+                    self._state_version += 1
                     return False
 
-            # Mark as enabled
-            state.enabled = True
-            state.enable_count += 1
-            state.last_error = None
-            state.enabled_by.add(caller)
-            self.enabled_domains.add(domain)
-            self._update_domain_usage(domain, caller)
-
-            logger.info(f"Enabled domain {domain.value} (risk: {config.risk_level.value}, caller: {caller})")
+            self._mark_domain_enabled(domain, caller)
             return True
 
         except Exception as e:
             logger.error(f"Exception enabling {domain.value}: {e}")
             state.last_error = str(e)
+            self._state_version += 1
             return False
 
+    def _mark_domain_enabled(self, domain: CDPDomain, caller: str):
+        """Record a domain as enabled (its CDP enable command, if any, succeeded)"""
+        state = self.domain_states[domain]
+        state.enabled = True
+        state.enable_count += 1
+        state.last_error = None
+        state.enabled_by.add(caller)
+        self.enabled_domains.add(domain)
+        self.enabled_domain_values.add(domain.value)
+        self._update_domain_usage(domain, caller)
+        self._state_version += 1
+
+        logger.info(f"Enabled domain {domain.value} (risk: {state.config.risk_level.value}, caller: {caller})")
+
+    def _enable_domains_batch(self, domains: List[CDPDomain], caller: str) -> int:
+        """
+        Enable several domains with their CDP enable commands pipelined
+
+        All '<Domain>.enable' commands are written back-to-back and awaited
+        together, so startup costs one round-trip instead of one per domain.
+        Domains with dependencies go through ensure_domain to keep ordering.
+
+        @param domains - Domains to enable
+        @param caller - Identifier of the caller (for tracking)
+        @returns Number of domains enabled (including already-enabled ones)
+        """
+        enabled_count = 0
+
+        with self._lock:
+            pending: List[CDPDomain] = []
+            for domain in domains:
+                state = self.domain_states[domain]
+                if state.enabled:
+                    self._update_domain_usage(domain, caller)
+                    enabled_count += 1
+                elif not self.can_enable_domain(domain):
+                    logger.warning(f"Domain {domain.value} blocked by risk level ({self.max_risk_level.value})")
+                elif state.config.dependencies:
+                    if self.ensure_domain(domain, caller):
+                        enabled_count += 1
+                else:
+                    pending.append(domain)
+
+            to_send = [d for d in pending if self.domain_states[d].config.requires_enable]
+            results: Dict[CDPDomain, dict] = {}
+            if to_send and self.cdp_client:
+                try:
+                    responses = self.cdp_client.send_commands_batch(
+                        [(d.enable_cmd, None) for d in to_send], timeout=10
+                    )
+                    results = dict(zip(to_send, responses))
+                except Exception as e:
+                    logger.error(f"Exception enabling domains {[d.value for d in to_send]}: {e}")
+                    for domain in to_send:
+                        self.domain_states[domain].last_error = str(e)
+                    self._state_version += 1
+                    pending = [d for d in pending if d not in to_send]
+
+            for domain in pending:
+                result = results.get(domain)
+                if result is not None and 'error' in result:
+                    error_msg = result.get('error', 'Unknown error')
+                    logger.warning(f"Failed to enable {domain.value}: {error_msg}")
+                    self.domain_states[domain].last_error = error_msg
+                    self._state_version += 1
+                    continue
+
+                self._mark_domain_enabled(domain, caller)
+                enabled_count += 1
+
+        return enabled_count
+
     def _update_domain_usage(self, domain: CDPDomain, caller: str):
         """Update domain usage tracking"""
         state = self.domain_states[domain]
-        state.last_used = time.time()
-        state.enabled_by.add(caller)
+        now = time.time()
+        if now - state.last_used >= self.USAGE_UPDATE_GRANULARITY:
+            state.last_used = now
+        if caller not in state.enabled_by:
+            state.enabled_by.add(caller)
+            self._state_version += 1
 
     def disable_domain(self, domain: CDPDomain, force: bool = False) -> bool:
         """
@@ -218,50 +364,84 @@ class DomainManager:
         @returns True if disabled
         """
         with self._lock:
-            state = self.domain_states[domain]
+            return self._disable_domain_locked(domain, force)
 
-            if not state.enabled:
-                return True
+    def _disable_domain_locked(self, domain: CDPDomain, force: bool = False) -> bool:
+        """
+        Disable a domain; caller must hold self._lock
 
-            if not force and len(state.enabled_by) > 1:
-                logger.info(f"Not disabling {domain.value} - still used by {len(state.enabled_by)} callers")
-                return False
+        @param domain - Domain to disable
+        @param force - Force disable even if other callers are using it
+        @returns True if disabled
+        """
+        state = self.domain_states[domain]
 
-            config = self.DOMAIN_CONFIGS.get(domain)
-            if config and config.requires_enable and self.cdp_client:
-                result = self.cdp_client.send_command(f"{domain.value}.disable", timeout=5)
-                if 'error' in result:
-                    logger.warning(f"Failed to disable {domain.value}: {result.get('error')}")
+        if not state.enabled:
+            return True
 
-            state.enabled = False
-            state.enabled_by.clear()
-            self.enabled_domains.discard(domain)
+        if not force and len(state.enabled_by) > 1:
+            logger.info(f"Not disabling {domain.value} - still used by {len(state.enabled_by)} callers")
+            return False
 
-            logger.info(f"Disabled domain {domain.value}")
-            return True
+        config = state.config
+        if config and config.requires_enable and self.cdp_client:
+            result = self.cdp_client.send_command(domain.disable_cmd, timeout=5)
+            if 'error' in result:
+                logger.warning(f"Failed to disable {domain.value}: {result.get('error')}")
+
+        state.enabled = False
+        state.enabled_by.clear()
+        self.enabled_domains.discard(domain)
+        self.enabled_domain_values.discard(domain.value)
+        self._state_version += 1
+
+        logger.info(f"Disabled domain {domain.value}")
+        return True
 
     def get_domain_status(self) -> Dict[str, any]:
         """Get comprehensive domain status"""
-        with self._lock:
-            status = {
-                "max_risk_level": self.max_risk_level.value,
-                "enabled_domains": [d.value for d in self.enabled_domains],
-                "domain_details": {}
+        cache = self._status_cache
+        if cache is None or cache[0] != self._state_version:
+            with self._lock:
+                cache = (self._state_version, self._build_domain_status())
+                self._status_cache = cache
+
+        # Copy out of the cache with current last_used - the only field that
+        # changes without a version bump
+        cached = cache[1]
+        details = {}
+        for domain, state in self.domain_states.items():
+            detail = dict(cached["domain_details"][domain.value])
+            detail["last_used"] = state.last_used
+            details[domain.value] = detail
+
+        return {
+            "max_risk_level": cached["max_risk_level"],
+            "enabled_domains": list(cached["enabled_domains"]),
+            "domain_details": details
+        }
+
+    def _build_domain_status(self) -> Dict[str, Any]:
+        """Build the full status snapshot (caller holds the lock)"""
+        status = {
+            "max_risk_level": self.max_risk_level.value,
+            "enabled_domains": [d.value for d in self.enabled_domains],
+            "domain_details": {}
+        }
+
+        for domain, state in self.domain_states.items():
+            config = state.config
+            status["domain_details"][domain.value] = {
+                "enabled": state.enabled,
+                "risk_level": config.risk_level.value if config else "unknown",
+                "can_enable": self.can_enable_domain(domain),
+                "last_used": state.last_used,
+                "enable_count": state.enable_count,
+                "enabled_by": list(state.enabled_by),
+                "last_error": state.last_error
             }
 
-            for domain, state in self.domain_states.items():
-                config = self.DOMAIN_CONFIGS.get(domain)
-                status["domain_details"][domain.value] = {
-                    "enabled": state.enabled,
-                    "risk_level": config.risk_level.value if config else "unknown",
-                    "can_enable": self.can_enable_domain(domain),
-                    "last_used": state.last_used,
-                    "enable_count": state.enable_count,
-                    "enabled_by": list(state.enabled_by),
-                    "last_error": state.last_error
-                }
-
-            return status
+        return status
 
     def cleanup_unused_domains(self, max_age_minutes: int = 15) -> int:
         """
@@ -270,15 +450,16 @@ class DomainManager:
         @param max_age_minutes - Domains unused for this long will be disabled
         @returns Number of domains disabled
         """
+        if not self.auto_unload_enabled:
+            return 0
+
         current_time = time.time()
         cleanup_count = 0
 
         with self._lock:
-            for domain, state in self.domain_states.items():
-                if not state.enabled:
-                    continue
-
-                config = self.DOMAIN_CONFIGS.get(domain)
+            for domain in list(self.enabled_domains):
+                state = self.domain_states[domain]
+                config = state.config
                 if not config or config.risk_level == DomainRiskLevel.SAFE:
                     continue  # Don't auto-cleanup safe domains
 
@@ -287,7 +468,7 @@ class DomainManager:
                 age_minutes = (current_time - state.last_used) / 60
 
                 if age_minutes > timeout_minutes:
-                    if self.disable_domain(domain, force=False):
+                    if self._disable_domain_locked(domain, force=False):
                         cleanup_count += 1
                         logger.info(f"Auto-disabled unused domain {domain.value} (unused for {age_minutes:.1f}m)")
 
@@ -303,30 +484,24 @@ class DomainManager:
             CDPDomain.CONSOLE
         ]
 
-        success_count = 0
-        for domain in safe_domains:
-            if self.ensure_domain(domain, "default_startup"):
-                success_count += 1
+        success_count = self._enable_domains_batch(safe_domains, "default_startup")
 
         logger.info(f"Enabled {success_count}/{len(safe_domains)} default domains")
         return success_count == len(safe_domains)
 
     def set_risk_level(self, new_level: DomainRiskLevel):
         """Update maximum risk level (runtime configuration)"""
-        old_level = self.max_risk_level
-        self.max_risk_level = new_level
-        logger.info(f"Updated max risk level: {old_level.value} -> {new_level.value}")
-
-        # If we reduced risk level, disable domains that are now too risky
-        if new_level.value != old_level.value:
-            with self._lock:
-                to_disable = []
-                for domain in self.enabled_domains:
-                    if not self.can_enable_domain(domain):
-                        to_disable.append(domain)
-
-                for domain in to_disable:
-                    self.disable_domain(domain, force=True)
+        with self._lock:
+            old_level = self.max_risk_level
+            self.max_risk_level = new_level
+            self._risk_allowed = self._allowed_by_risk[new_level]
+            self._state_version += 1
+            logger.info(f"Updated max risk level: {old_level.value} -> {new_level.value}")
+
+            # If we reduced risk level, disable domains that are now too risky
+            if new_level is not old_level:
+                for domain in list(self.enabled_domains - self._risk_allowed):
+                    self._disable_domain_locked(domain, force=True)
                     logger.info(f"Disabled {domain.value} due to reduced risk tolerance")
 
     def set_auto_unload_enabled(self, enabled: bool):
@@ -341,11 +516,8 @@ class DomainManager:
 
     def enable_all_allowed_domains(self):
         """Enable all domains that are allowed by current risk level (eager loading)"""
-        enabled_count = 0
-        for domain in CDPDomain:
-            if self.can_enable_domain(domain):
-                if self.ensure_domain(domain, "eager_load"):
-                    enabled_count += 1
+        allowed = [domain for domain in CDPDomain if self.can_enable_domain(domain)]
+        enabled_count = self._enable_domains_batch(allowed, "eager_load")
 
         logger.info(f"Eager loading: enabled {enabled_count} domains")
         return enabled_count
@@ -360,6 +532,12 @@ def get_domain_manager() -> DomainManager:
     """Get or create global domain manager"""
     global _global_domain_manager
 
+    # Lock-free read for the common already-created case; the lock only
+    # guards construction
+    domain_manager = _global_domain_manager
+    if domain_manager is not None:
+        return domain_manager
+
     with _domain_manager_lock:
         if _global_domain_manager is None:
             _global_domain_manager = DomainManager()
@@ -8,11 +8,14 @@ issue where events were fragmented across multiple client instances.
 
 import logging
 import time
-from collections import defaultdict, deque
+from itertools import islice
+from collections import deque
 from dataclasses import dataclass
 from threading import Lock, RLock
 from typing import Dict, List, Optional, Any, Callable
-from queue import Queue, Empty, Full
+
+# domain_manager imports nothing from this package, so this is cycle-free
+from .domain_manager import get_domain_manager
 
 # Import CDPEvent from cdp_client to avoid circular imports
 # This will be imported when cdp_client imports this module
@@ -47,16 +50,22 @@ class EventManager:
         self.max_total_events = max_total_events
 
         # Thread-safe event storage
-        self.events_by_domain: Dict[str, deque] = defaultdict(
-            lambda: deque(maxlen=max_events_per_domain)
-        )
-        self.event_queue = Queue(maxsize=max_total_events)
-
-        # Event handlers - domain-specific callbacks
-        self.event_handlers: Dict[str, List[Callable]] = defaultdict(list)
-
-        # Thread safety
-        self.lock = RLock()
+        # Plain dict - a deque is only created when a domain actually stores an
+        # event, never as a side effect of reading an unknown domain
+        self.events_by_domain: Dict[str, deque] = {}
+        # Ring of the most recent events across all domains - appending to a
+        # full deque overwrites the oldest entry instead of refusing the newest
+        self.all_events: deque = deque(maxlen=max_total_events)
+
+        # Event handlers - domain-specific callbacks. Copy-on-write: writers
+        # swap in a new list under _handlers_lock, dispatch reads without a lock
+        self.event_handlers: Dict[str, List[Callable]] = {}
+
+        # Thread safety - sharded so events for one domain never wait on another:
+        # one lock per domain deque, one for the shared ring and counters
+        self._domain_locks: Dict[str, Lock] = {}
+        self._stats_lock = Lock()
+        self._handlers_lock = Lock()
 
         # Event statistics
         self.total_events_received = 0
@@ -74,55 +83,74 @@ class EventManager:
         Returns:
             bool: True if stored successfully, False if dropped
         """
-        with self.lock:
-            # Import here to avoid circular imports
-            from .domain_manager import get_domain_manager
-
-            # Only store events for enabled domains
-            domain_manager = get_domain_manager()
-            if not domain_manager:
-                logger.warning("No domain manager available, storing event anyway")
-            else:
-                # Check if domain is enabled (convert string domain to enum if needed)
-                domain_enabled = False
-                try:
-                    from .domain_manager import CDPDomain
-                    for enabled_domain in domain_manager.enabled_domains:
-                        if enabled_domain.value == event.domain:
-                            domain_enabled = True
-                            break
-                except Exception as e:
-                    logger.debug(f"Error checking domain enabled status: {e}")
-                    # Fall back to storing event anyway
-                    domain_enabled = True
-
-                if not domain_enabled:
-                    logger.debug(f"Dropping event for disabled domain: {event.domain}")
-                    return False
-
-            # Store in domain-specific queue
-            self.events_by_domain[event.domain].append(event)
-
-            # Store in general event queue (non-blocking, drop if full)
-            try:
-                self.event_queue.put_nowait(event)
-            except Full:
+        if not self.accepts_domain(event.domain):
+            logger.debug("Dropping event for disabled domain: %s", event.domain)
+            return False
+
+        # Store in domain-specific queue
+        with self._domain_lock(event.domain):
+            domain_events = self.events_by_domain.get(event.domain)
+            if domain_events is None:
+                domain_events = self.events_by_domain[event.domain] = deque(maxlen=self.max_events_per_domain)
+            domain_events.append(event)
+
+        with self._stats_lock:
+            # Store in general event ring (oldest event is evicted when full)
+            if len(self.all_events) == self.max_total_events:
                 self.events_dropped += 1
-                logger.debug(f"Event queue full, dropped {event.method} event (total dropped: {self.events_dropped})")
+            self.all_events.append(event)
 
             # Update statistics
             self.total_events_received += 1
 
-            # Trigger registered handlers
-            for handler in self.event_handlers.get(event.method, []):
+        # Trigger registered handlers - the common case is none at all, so
+        # skip the method lookup entirely while the registry is empty
+        if self.event_handlers:
+            for handler in self.event_handlers.get(event.method, ()):
                 try:
                     handler(event)
                 except Exception as e:
-                    logger.error(f"Event handler error for {event.method}: {e}")
+                    logger.error("Event handler error for %s: %s", event.method, e)
+
+        logger.debug("Stored event: %s in domain %s", event.method, event.domain)
+        return True
+
+    def _domain_lock(self, domain: str) -> Lock:
+        """
+        Get the lock guarding one domain's event deque
+
+        Args:
+            domain: CDP domain name
+
+        Returns:
+            Lock for that domain (created on first use)
+        """
+        lock = self._domain_locks.get(domain)
+        if lock is None:
+            # setdefault is atomic, so racing creators end up sharing one lock
+            lock = self._domain_locks.setdefault(domain, Lock())
+        return lock
+
+    def accepts_domain(self, domain: str) -> bool:
+        """
+        Check whether events for a domain would be stored
 
-            logger.debug(f"Stored event: {event.method} in domain {event.domain}")
+        store_event applies this once per event; the CDP client hands events
+        over unparsed, so a dropped event is never decoded at all.
+
+        Args:
+            domain: CDP domain name (e.g., 'Network')
+
+        Returns:
+            bool: True if the domain is enabled (or cannot be checked)
+        """
+        domain_manager = get_domain_manager()
+        if not domain_manager:
+            logger.warning("No domain manager available, storing event anyway")
             return True
 
+        return domain in domain_manager.enabled_domain_values
+
     def get_recent_events(self, domain: Optional[str] = None, limit: int = 50) -> List['CDPEvent']:
         """
         Get recent events, optionally filtered by domain
@@ -134,36 +162,23 @@ class EventManager:
         Returns:
             List of CDPEvent objects
         """
-        with self.lock:
-            if domain:
-                # Get events from specific domain
-                events = list(self.events_by_domain[domain])
-                return events[-limit:] if events else []
-            else:
-                # Get events from general queue
-                events = []
-                try:
-                    # Create a temporary list to preserve queue order
-                    temp_events = []
-                    while not self.event_queue.empty() and len(temp_events) < limit:
-                        temp_events.append(self.event_queue.get_nowait())
-
-                    # Put events back in queue (FIFO order)
-                    for event in temp_events:
-                        try:
-                            self.event_queue.put_nowait(event)
-                        except Full:
-                            # Queue refill failed, event is lost
-                            self.events_dropped += 1
-                            pass
-
-                    # Return most recent events
-                    events = temp_events[-limit:] if temp_events else []
-
-                except Empty:
-                    pass
+        if domain:
+            # Get events from specific domain
+            events = self.events_by_domain.get(domain)
+            if events is None:
+                return []
+            lock = self._domain_lock(domain)
+        else:
+            # Get events from general ring
+            events = self.all_events
+            lock = self._stats_lock
 
-                return events
+        # Walk back from the newest entry only as far as needed - O(limit),
+        # not a copy of the whole ring - then restore chronological order
+        with lock:
+            recent = list(islice(reversed(events), max(limit, 0)))
+        recent.reverse()
+        return recent
 
     def clear_events(self, domain: Optional[str] = None):
         """
@@ -172,28 +187,25 @@ class EventManager:
         Args:
             domain: Domain to clear (None for all domains)
         """
-        with self.lock:
-            if domain:
-                self.events_by_domain[domain].clear()
-                logger.info(f"Cleared events for domain: {domain}")
-            else:
-                # Clear all events
-                # Empty the queue by consuming all items
-                while not self.event_queue.empty():
-                    try:
-                        self.event_queue.get_nowait()
-                    except:
-                        break
-
-                # Clear all domain-specific queues
-                for domain_queue in self.events_by_domain.values():
-                    domain_queue.clear()
-
-                # Reset statistics
+        if domain:
+            domain_events = self.events_by_domain.get(domain)
+            if domain_events is not None:
+                with self._domain_lock(domain):
+                    domain_events.clear()
+            logger.info(f"Cleared events for domain: {domain}")
+        else:
+            # Clear all events and reset statistics
+            with self._stats_lock:
+                self.all_events.clear()
                 self.total_events_received = 0
                 self.events_dropped = 0
 
-                logger.info("Cleared all events")
+            # Clear all domain-specific queues
+            for domain_name, domain_queue in list(self.events_by_domain.items()):
+                with self._domain_lock(domain_name):
+                    domain_queue.clear()
+
+            logger.info("Cleared all events")
 
     def register_event_handler(self, method: str, handler: Callable[['CDPEvent'], None]):
         """
@@ -203,8 +215,8 @@ class EventManager:
             method: CDP method name (e.g., 'Console.messageAdded')
             handler: Callback function
         """
-        with self.lock:
-            self.event_handlers[method].append(handler)
+        with self._handlers_lock:
+            self.event_handlers[method] = self.event_handlers.get(method, []) + [handler]
             logger.debug(f"Registered event handler for {method}")
 
     def unregister_event_handler(self, method: str, handler: Callable[['CDPEvent'], None]):
@@ -215,9 +227,15 @@ class EventManager:
             method: CDP method name
             handler: Callback function to remove
         """
-        with self.lock:
-            if handler in self.event_handlers[method]:
-                self.event_handlers[method].remove(handler)
+        with self._handlers_lock:
+            handlers = self.event_handlers.get(method)
+            if handlers and handler in handlers:
+                remaining = [h for h in handlers if h is not handler]
+                if remaining:
+                    self.event_handlers[method] = remaining
+                else:
+                    # Drop empty entries so store_event's empty-registry check holds
+                    del self.event_handlers[method]
                 logger.debug(f"Unregistered event handler for {method}")
 
     def get_statistics(self) -> Dict[str, Any]:
@@ -227,27 +245,31 @@ class EventManager:
         Returns:
             Dictionary with statistics
         """
-        with self.lock:
-            domain_counts = {}
-            for domain, events in self.events_by_domain.items():
-                domain_counts[domain] = len(events)
-
-            return {
-                "total_events_received": self.total_events_received,
-                "events_dropped": self.events_dropped,
-                "current_queue_size": self.event_queue.qsize(),
-                "domains_with_events": domain_counts,
-                "event_handlers_registered": {
-                    method: len(handlers) for method, handlers in self.event_handlers.items()
-                }
+        domain_counts = {}
+        for domain, events in list(self.events_by_domain.items()):
+            domain_counts[domain] = len(events)
+
+        with self._stats_lock:
+            total_received = self.total_events_received
+            dropped = self.events_dropped
+            queue_size = len(self.all_events)
+
+        return {
+            "total_events_received": total_received,
+            "events_dropped": dropped,
+            "current_queue_size": queue_size,
+            "domains_with_events": domain_counts,
+            "event_handlers_registered": {
+                method: len(handlers) for method, handlers in list(self.event_handlers.items())
             }
+        }
 
     def shutdown(self):
         """Clean shutdown of event manager"""
-        with self.lock:
-            self.clear_events()
+        self.clear_events()
+        with self._handlers_lock:
             self.event_handlers.clear()
-            logger.info("EventManager shut down")
+        logger.info("EventManager shut down")
 
 
 def initialize_event_manager(max_events_per_domain: int = 100, max_total_events: int = 10000) -> EventManager:
@@ -282,6 +304,12 @@ def get_event_manager() -> Optional[EventManager]:
     """
     global _global_event_manager
 
+    # Lock-free read for the common already-initialized case - a module
+    # global load is atomic under the GIL
+    event_manager = _global_event_manager
+    if event_manager is not None:
+        return event_manager
+
     with _event_manager_lock:
         if _global_event_manager is None:
             logger.warning("EventManager not initialized, auto-initializing")
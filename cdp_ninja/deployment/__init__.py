@@ -3,16 +3,7 @@ CDP Ninja Deployment Module
 Handles deployment, installation, and setup operations
 """
 
-from .cli import (
-    handle_usage, handle_install_agents, handle_install_deps,
-    handle_tunnel, handle_invoke_claude, handle_shell,
-    SHELL_ENABLED
-)
-
-from .platforms import detect_local_platform, detect_remote_platform
-from .ssh_utils import verify_ssh_access_remote, check_remote_dependencies, setup_ssh_tunnel, start_claude_interface
-from .verification import verify_remote_installations, verify_local_installations
-from .installers import install_deps_local, install_deps_remote
+from .._lazy import lazy_module
 
 __all__ = [
     'handle_usage', 'handle_install_agents', 'handle_install_deps',
@@ -23,4 +14,29 @@ __all__ = [
     'setup_ssh_tunnel', 'start_claude_interface',
     'verify_remote_installations', 'verify_local_installations',
     'install_deps_local', 'install_deps_remote'
-]
\ No newline at end of file
+]
+
+# Resolved on first access (PEP 562) so importing the CLI handlers doesn't
+# load the SSH, installer and verification helpers until a command uses them
+_LAZY_EXPORTS = {
+    'handle_usage': '.cli',
+    'handle_install_agents': '.cli',
+    'handle_install_deps': '.cli',
+    'handle_tunnel': '.cli',
+    'handle_invoke_claude': '.cli',
+    'handle_shell': '.cli',
+    'SHELL_ENABLED': '.cli',
+    'detect_local_platform': '.platforms',
+    'detect_remote_platform': '.platforms',
+    'verify_ssh_access_remote': '.ssh_utils',
+    'check_remote_dependencies': '.ssh_utils',
+    'setup_ssh_tunnel': '.ssh_utils',
+    'start_claude_interface': '.ssh_utils',
+    'verify_remote_installations': '.verification',
+    'verify_local_installations': '.verification',
+    'install_deps_local': '.installers',
+    'install_deps_remote': '.installers',
+}
+
+
+__getattr__, __dir__ = lazy_module(__name__, _LAZY_EXPORTS)
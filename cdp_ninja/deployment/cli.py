@@ -3,15 +3,148 @@ CDP Ninja CLI Command Handlers
 Handles deployment and operational CLI commands
 """
 
+from functools import lru_cache
 from pathlib import Path
-import platform
-from .ssh_utils import setup_ssh_tunnel, start_claude_interface, show_tunnel_instructions, show_invoke_claude_instructions
-from .verification import verify_remote_installations, verify_local_installations
-from .installers import install_deps_local, install_deps_remote
+import os
+import re
+import signal
+import subprocess
+import sys
+import time
+from types import MappingProxyType
+from ..core.domain_manager import (
+    CDPDomain, DomainManager, DomainRiskLevel, get_domain_manager, initialize_domain_manager
+)
 
 # Global flag for shell execution
 SHELL_ENABLED = False
 
+# --max-risk-level choices -> DomainRiskLevel
+_RISK_LEVELS = MappingProxyType({level.value: level for level in DomainRiskLevel})
+
+# --list-domains marker per risk level
+_RISK_COLORS = MappingProxyType({
+    DomainRiskLevel.SAFE: "🟢",
+    DomainRiskLevel.LOW: "🟡",
+    DomainRiskLevel.MEDIUM: "🟠",
+    DomainRiskLevel.HIGH: "🔴",
+    DomainRiskLevel.VERY_HIGH: "🚨"
+})
+
+# Command line of a CDP Ninja reverse tunnel (ssh ... -R port:127.0.0.1:port host)
+_SSH_TUNNEL_CMD_RE = re.compile(r'ssh.*-R.*127\.0\.0\.1')
+
+# One pgrep output row: "<pid> ssh [flags] -R port:127.0.0.1:port host" -
+# setup_ssh_tunnel always puts the host last
+_PGREP_TUNNEL_RE = re.compile(r'^(?P<pid>\d+)[ \t]+\S.*?(?P<host>\S+)[ \t]*$', re.MULTILINE)
+
+# prompt_file_conflict answers (short and long forms) -> action
+_CONFLICT_CHOICES = {
+    'o': 'overwrite', 'overwrite': 'overwrite',
+    's': 'skip', 'skip': 'skip',
+    'a': 'all', 'all': 'all',
+    'q': 'quit', 'quit': 'quit',
+}
+
+# Line prefixes handle_usage formats specially (tables are matched by '|' anywhere)
+_MD_LINE_RE = re.compile(r'(?P<fence>```)|(?P<h1># )|(?P<h2>## )|(?P<h3>### )|(?P<item>- )')
+
+
+def _format_usage_markdown(lines):
+    """
+    Render the usage markdown for terminal display
+
+    @param lines - Markdown source lines, without line endings
+    @returns Formatted text, ready to write in one go
+    """
+    out = []
+    emit = out.append
+    in_code_block = False
+    in_table = False
+
+    for line in lines:
+        # One anchored regex match classifies the line prefix
+        match = _MD_LINE_RE.match(line)
+        kind = match.lastgroup if match else None
+
+        # Handle code blocks
+        if kind == 'fence':
+            in_code_block = not in_code_block
+            emit("─" * 40)
+            continue
+
+        # Handle tables
+        if '|' in line and not in_code_block:
+            in_table = True
+            # Format table rows
+            if line.startswith('|'):
+                emit(f"   {line.replace('|', '│').strip()}")
+            continue
+        elif in_table and '|' not in line:
+            in_table = False
+            emit("")
+
+        # Format headers
+        if kind == 'h1':
+            emit(f"\n🔥 {line[2:]}")
+            emit("=" * len(line))
+        elif kind == 'h2':
+            emit(f"\n💠 {line[3:]}")
+            emit("─" * len(line))
+        elif kind == 'h3':
+            emit(f"\n⚡ {line[4:]}")
+        # Format code blocks with indentation
+        elif in_code_block:
+            emit(f"   {line}")
+        # Format list items
+        elif kind == 'item':
+            emit(f"  • {line[2:]}")
+        # Regular lines
+        else:
+            emit(line if line.strip() else "")
+
+    return "".join(f"{text}\n" for text in out)
+
+
+def _split_lines(f):
+    """
+    Yield a text file's lines without endings, like f.read().split('\\n')
+
+    A trailing newline (or an empty file) yields a final empty line, exactly as
+    the split would, so rendered output does not depend on how it was read.
+
+    @param f - Text file object
+    """
+    line = ''
+    for line in f:
+        yield line[:-1] if line.endswith('\n') else line
+    if not line or line.endswith('\n'):
+        yield ''
+
+
+def _render_usage_page(usage_path, docs_dir):
+    """
+    Render the full usage page: banner, formatted readme, docs file listing
+
+    @param usage_path - Path to docs/usage/readme.md
+    @param docs_dir - Directory listed in the page footer
+    @returns Page text
+    """
+    parts = ["🥷 CDP Ninja API Documentation\n", "=" * 50, "\n\n"]
+    # Stream the file line by line rather than reading and splitting it whole
+    with open(usage_path, 'r', encoding='utf-8') as f:
+        parts.append(_format_usage_markdown(_split_lines(f)))
+
+    parts.append("\n📁 Full documentation files:\n")
+    # Only names are needed, so a bare directory listing suffices
+    with os.scandir(docs_dir) as entries:
+        doc_names = sorted(entry.name for entry in entries
+                           if entry.name.endswith('.md') and entry.name != "readme.md")
+    for doc_name in doc_names:
+        parts.append(f"   • {doc_name}\n")
+
+    return "".join(parts)
+
 
 def handle_usage():
     """Output API documentation overview and domain guide"""
@@ -22,64 +155,10 @@ def handle_usage():
             print(f"   Expected: {usage_path}")
             return
 
-        print("🥷 CDP Ninja API Documentation")
-        print("=" * 50)
-        print()
-
-        with open(usage_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        # Parse and format the markdown content for CLI display
-        lines = content.split('\n')
-        in_code_block = False
-        in_table = False
-
-        for line in lines:
-            # Handle code blocks
-            if line.startswith('```'):
-                in_code_block = not in_code_block
-                print("─" * 40)
-                continue
-
-            # Handle tables
-            if '|' in line and not in_code_block:
-                in_table = True
-                # Format table rows
-                if line.startswith('|'):
-                    formatted_line = line.replace('|', '│').strip()
-                    print(f"   {formatted_line}")
-                continue
-            elif in_table and not '|' in line:
-                in_table = False
-                print()
-
-            # Format headers
-            if line.startswith('# '):
-                print(f"\n🔥 {line[2:]}")
-                print("=" * len(line))
-            elif line.startswith('## '):
-                print(f"\n💠 {line[3:]}")
-                print("─" * len(line))
-            elif line.startswith('### '):
-                print(f"\n⚡ {line[4:]}")
-            # Format code blocks with indentation
-            elif in_code_block:
-                print(f"   {line}")
-            # Format list items
-            elif line.startswith('- '):
-                print(f"  • {line[2:]}")
-            # Regular lines
-            elif line.strip():
-                print(line)
-            else:
-                print()
+        page = _render_usage_page(usage_path, usage_path.parent)
 
-        print("\n📁 Full documentation files:")
-        docs_dir = Path(__file__).parent.parent.parent / "docs" / "usage"
-        if docs_dir.exists():
-            for doc_file in sorted(docs_dir.glob("*.md")):
-                if doc_file.name != "readme.md":
-                    print(f"   • {doc_file.name}")
+        # Write the whole page once instead of per line
+        sys.stdout.write(page)
 
     except Exception as e:
         print(f"❌ Error reading API documentation: {e}")
@@ -88,7 +167,29 @@ def handle_usage():
     return 0
 
 
-def handle_install_agents(target_path, instruct_only=False):
+@lru_cache(maxsize=None)
+def _agents_dir():
+    """Bundled agents directory, alongside the cdp_ninja package"""
+    return Path(__file__).parent.parent.parent / "agents"
+
+
+@lru_cache(maxsize=None)
+def _agent_files():
+    """
+    Agent definition files, enumerated once per process
+
+    @returns Sorted tuple of *.md paths (empty if the directory is missing)
+    """
+    # scandir entries carry the file type from the directory listing itself
+    try:
+        with os.scandir(_agents_dir()) as entries:
+            return tuple(sorted(Path(entry.path) for entry in entries
+                                if entry.name.endswith('.md') and entry.is_file()))
+    except FileNotFoundError:
+        return ()
+
+
+def handle_install_agents(target_path, instruct_only=False, on_conflict='prompt'):
     """Install agents locally or remotely with conflict resolution"""
     if instruct_only:
         show_install_agents_instructions(target_path)
@@ -97,14 +198,14 @@ def handle_install_agents(target_path, instruct_only=False):
     print(f"🥷 Installing CDP Ninja agents to: {target_path}")
 
     try:
-        agents_dir = Path(__file__).parent.parent.parent / "agents"
+        agents_dir = _agents_dir()
         if not agents_dir.exists():
             print(f"❌ Agents directory not found: {agents_dir}")
             print("💡 Expected location: /agents (relative to cdp_ninja package)")
             show_install_agents_instructions(target_path)
             return False
 
-        agent_files = list(agents_dir.glob("*.md"))
+        agent_files = list(_agent_files())
         if not agent_files:
             print(f"❌ No agent files found in: {agents_dir}")
             show_install_agents_instructions(target_path)
@@ -117,11 +218,11 @@ def handle_install_agents(target_path, instruct_only=False):
             # Remote installation via SCP
             print("🌐 Remote installation detected")
             host, remote_path = target_path.split(':', 1)
-            success = install_agents_remote(host, remote_path, agents_dir)
+            success = install_agents_remote(host, remote_path, agent_files)
         else:
             # Local installation
             print("💻 Local installation detected")
-            success = install_agents_local(target_path, agents_dir)
+            success = install_agents_local(target_path, agent_files, on_conflict)
 
         if success:
             print("\n🎉 Agent installation completed successfully!")
@@ -142,6 +243,8 @@ def handle_install_agents(target_path, instruct_only=False):
 
 def handle_install_deps(target_host, web_backend, instruct_only=False):
     """Install dependencies (Claude CLI, tmux, gotty/ttyd) on target system"""
+    from .installers import install_deps_local, install_deps_remote
+
     if instruct_only:
         show_install_deps_instructions(target_host, web_backend)
         return True
@@ -165,6 +268,8 @@ def handle_install_deps(target_host, web_backend, instruct_only=False):
 
 def handle_tunnel(target_host, instruct_only=False):
     """Setup reverse SSH tunnel for remote access to local CDP Ninja"""
+    from .ssh_utils import setup_ssh_tunnel, show_tunnel_instructions
+
     if instruct_only:
         show_tunnel_instructions(target_host)
         return True
@@ -186,6 +291,8 @@ def handle_tunnel(target_host, instruct_only=False):
 
 def handle_invoke_claude(target_host, web_backend, instruct_only=False):
     """Start Claude interface in tmux with web terminal"""
+    from .ssh_utils import start_claude_interface, show_invoke_claude_instructions
+
     if instruct_only:
         show_invoke_claude_instructions(target_host, web_backend)
         return True
@@ -223,120 +330,93 @@ def handle_shell():
 
 def handle_kill_tunnels():
     """Kill all active SSH tunnels for CDP Ninja (both local and remote sides)"""
-    import subprocess
     import platform
-    import re
 
     print("🔪 Killing all active SSH tunnels...")
 
     killed_count = 0
     remote_hosts = set()  # Track which hosts we need to clean up
+    system = platform.system()
 
     try:
-        if platform.system() == "Windows":
-            # Find SSH tunnel processes on Windows using PowerShell (more reliable than wmic)
+        if system == "Windows":
+            # One PowerShell process finds AND kills the tunnels (no taskkill per
+            # PID), reporting one "pid<TAB>status<TAB>command line" row for each
             powershell_cmd = [
-                'powershell', '-Command',
-                'Get-WmiObject Win32_Process | Where-Object {$_.Name -eq "ssh.exe" -and $_.CommandLine -like "*-R*" -and $_.CommandLine -like "*127.0.0.1*"} | Select-Object ProcessId,CommandLine | ConvertTo-Json'
+                'powershell', '-NoProfile', '-Command',
+                "Get-CimInstance Win32_Process -Filter 'Name=''ssh.exe''' | "
+                "Where-Object { $_.CommandLine -like '*-R*' -and $_.CommandLine -like '*127.0.0.1*' } | "
+                "ForEach-Object { $p = $_; "
+                "try { Stop-Process -Id $p.ProcessId -Force -ErrorAction Stop; $status = 'OK' } "
+                "catch { $status = $_.Exception.Message -replace '\\s+', ' ' }; "
+                "'{0}{3}{1}{3}{2}' -f $p.ProcessId, $status, $p.CommandLine, [char]9 }"
             ]
 
-            result = subprocess.run(powershell_cmd, capture_output=True, text=True, timeout=10)
+            result = subprocess.run(powershell_cmd, capture_output=True, text=True, timeout=15)
+
+            tunnel_count = 0
+            for line in result.stdout.splitlines():
+                fields = line.split('\t', 2)
+                if len(fields) != 3 or not fields[0].isdigit():
+                    continue
+                pid, status, command = fields
+                tunnel_count += 1
+                print(f"🎯 Found CDP tunnel: PID {pid}")
+                print(f"   Command: {command[:80]}...")
+
+                if status == 'OK':
+                    print(f"✅ Killed SSH tunnel (PID {pid})")
+                    killed_count += 1
+                else:
+                    print(f"❌ Failed to kill PID {pid}: {status}")
 
-            if result.returncode == 0 and result.stdout.strip():
-                import json
-                try:
-                    # Parse JSON output from PowerShell
-                    processes = json.loads(result.stdout.strip())
-
-                    # Handle single process (not in array) vs multiple processes (in array)
-                    if isinstance(processes, dict):
-                        processes = [processes]
-
-                    tunnel_pids = []
-                    for process in processes:
-                        pid = str(process.get('ProcessId', ''))
-                        command = process.get('CommandLine', '')
-                        if pid.isdigit():
-                            tunnel_pids.append(pid)
-                            print(f"🎯 Found CDP tunnel: PID {pid}")
-                            print(f"   Command: {command[:80]}...")
-
-                            # Extract remote host from command for cleanup
-                            # Pattern: ssh [flags] user@host or ssh [flags] host (hostname is always last)
-                            parts = command.split()
-                            if len(parts) >= 2:
-                                # Hostname is typically the last argument
-                                hostname = parts[-1]
-                                # Keep user@host format for proper authentication
-                                remote_hosts.add(hostname)
-
-                    for pid in tunnel_pids:
-                        try:
-                            kill_result = subprocess.run(
-                                ['taskkill', '/F', '/PID', pid],
-                                capture_output=True, text=True, timeout=5
-                            )
-                            if kill_result.returncode == 0:
-                                print(f"✅ Killed SSH tunnel (PID {pid})")
-                                killed_count += 1
-                            else:
-                                print(f"❌ Failed to kill PID {pid}: {kill_result.stderr}")
-                        except Exception as e:
-                            print(f"❌ Error killing PID {pid}: {e}")
-
-                    if not tunnel_pids:
-                        print("💡 No CDP Ninja SSH tunnels found")
-
-                except json.JSONDecodeError as e:
-                    print(f"❌ Error parsing PowerShell output: {e}")
-                    print("💡 No CDP Ninja SSH tunnels found")
-            else:
+                # Extract remote host for cleanup - setup_ssh_tunnel puts it
+                # last; keep user@host format for proper authentication
+                parts = command.split()
+                if len(parts) >= 2:
+                    remote_hosts.add(parts[-1])
+
+            if not tunnel_count:
                 print("💡 No CDP Ninja SSH tunnels found")
 
         else:
-            # Find SSH tunnel processes on Linux/Mac
-            result = subprocess.run(
-                ['ps', 'aux'],
-                capture_output=True, text=True, timeout=10
-            )
-
-            if result.returncode == 0:
-                tunnel_pids = []
-                for line in result.stdout.split('\n'):
-                    # Look for SSH processes with CDP Ninja reverse tunnel pattern (-R port:127.0.0.1:port)
-                    if 'ssh' in line and '-R' in line and '127.0.0.1' in line:
-                        parts = line.split()
-                        if len(parts) >= 2:
-                            pid = parts[1]
-                            tunnel_pids.append(pid)
-
-                            # Extract remote host from command for cleanup
-                            parts = line.split()
-                            # Find hostname (usually after ssh command and flags)
-                            for i, part in enumerate(parts):
-                                if 'ssh' in parts[i-1] if i > 0 else False:
-                                    continue
-                                if not part.startswith('-') and ('.' in part or '@' in part):
-                                    # Keep user@host format for proper authentication
-                                    remote_hosts.add(part)
-                                    break
-
-                for pid in tunnel_pids:
-                    try:
-                        kill_result = subprocess.run(
-                            ['kill', pid],
-                            capture_output=True, text=True, timeout=5
-                        )
-                        if kill_result.returncode == 0:
-                            print(f"✅ Killed SSH tunnel (PID {pid})")
-                            killed_count += 1
-                        else:
-                            print(f"❌ Failed to kill PID {pid}: {kill_result.stderr}")
-                    except Exception as e:
-                        print(f"❌ Error killing PID {pid}: {e}")
-
-                if not tunnel_pids:
-                    print("💡 No SSH tunnels found")
+            # Find SSH tunnel processes on Linux/Mac with a single pgrep
+            # (Linux lists full command lines with -a, macOS with -l)
+            list_flag = '-lf' if system == "Darwin" else '-af'
+            try:
+                result = subprocess.run(
+                    ['pgrep', list_flag, _SSH_TUNNEL_CMD_RE.pattern],
+                    capture_output=True, text=True, timeout=10
+                )
+                listing = result.stdout
+            except FileNotFoundError:
+                # No pgrep (minimal images) - filter a "<pid> <args>" ps listing instead
+                result = subprocess.run(
+                    ['ps', '-eo', 'pid=,args='],
+                    capture_output=True, text=True, timeout=10
+                )
+                listing = '\n'.join(line.strip() for line in result.stdout.splitlines()
+                                    if _SSH_TUNNEL_CMD_RE.search(line))
+
+            tunnel_pids = []
+            for match in _PGREP_TUNNEL_RE.finditer(listing):
+                tunnel_pids.append(match.group('pid'))
+                # Keep user@host format for proper authentication
+                remote_hosts.add(match.group('host'))
+
+            for pid in tunnel_pids:
+                try:
+                    os.kill(int(pid), signal.SIGTERM)
+                    print(f"✅ Killed SSH tunnel (PID {pid})")
+                    killed_count += 1
+                except ProcessLookupError:
+                    # Exited between pgrep and now - nothing left to kill
+                    print(f"💡 SSH tunnel already exited (PID {pid})")
+                except OSError as e:
+                    print(f"❌ Failed to kill PID {pid}: {e}")
+
+            if not tunnel_pids:
+                print("💡 No SSH tunnels found")
 
     except subprocess.TimeoutExpired:
         print("❌ Timeout while searching for SSH tunnels")
@@ -345,28 +425,16 @@ def handle_kill_tunnels():
         print(f"❌ Error searching for SSH tunnels: {e}")
         return False
 
-    # Clean up remote SSH daemons that might be holding ports
+    # Clean up remote SSH daemons that might be holding ports - hosts are
+    # independent, so clean them concurrently rather than one after another
     if remote_hosts:
-        print(f"\n🧹 Cleaning up remote SSH daemons on {len(remote_hosts)} host(s)...")
-        for host in remote_hosts:
-            try:
-                print(f"   🎯 Cleaning {host}...")
-                # Find PIDs bound to tunnel ports and kill them
-                cleanup_cmd = [
-                    'ssh', host,
-                    'for port in $(seq 8888 8899); do ss -tlnp | grep ":$port " | sed -n "s/.*pid=\\([0-9]*\\).*/\\1/p" | xargs -r kill 2>/dev/null || true; done'
-                ]
-                result = subprocess.run(cleanup_cmd, capture_output=True, text=True, timeout=15)
-
-                if result.returncode == 0:
-                    print(f"   ✅ Remote cleanup completed for {host}")
-                else:
-                    print(f"   ⚠️  Remote cleanup warning for {host}: {result.stderr.strip()}")
+        from concurrent.futures import ThreadPoolExecutor, as_completed
 
-            except subprocess.TimeoutExpired:
-                print(f"   ⚠️  Remote cleanup timeout for {host}")
-            except Exception as e:
-                print(f"   ⚠️  Remote cleanup failed for {host}: {e}")
+        print(f"\n🧹 Cleaning up remote SSH daemons on {len(remote_hosts)} host(s)...")
+        with ThreadPoolExecutor(max_workers=min(16, len(remote_hosts))) as executor:
+            futures = [executor.submit(_cleanup_remote_tunnel_ports, host) for host in remote_hosts]
+            for future in as_completed(futures):
+                print(future.result())
 
     if killed_count > 0:
         print(f"\n🎉 Successfully killed {killed_count} local SSH tunnel(s)")
@@ -378,19 +446,40 @@ def handle_kill_tunnels():
     return True
 
 
+def _cleanup_remote_tunnel_ports(host):
+    """Kill whatever holds the tunnel ports on a remote host; returns a status line"""
+
+    try:
+        # Find PIDs bound to tunnel ports and kill them
+        cleanup_cmd = [
+            'ssh', host,
+            'for port in $(seq 8888 8899); do ss -tlnp | grep ":$port " | sed -n "s/.*pid=\\([0-9]*\\).*/\\1/p" | xargs -r kill 2>/dev/null || true; done'
+        ]
+        result = subprocess.run(cleanup_cmd, capture_output=True, text=True, timeout=15)
+
+        if result.returncode == 0:
+            return f"   ✅ Remote cleanup completed for {host}"
+        return f"   ⚠️  Remote cleanup warning for {host}: {result.stderr.strip()}"
+
+    except subprocess.TimeoutExpired:
+        return f"   ⚠️  Remote cleanup timeout for {host}"
+    except Exception as e:
+        return f"   ⚠️  Remote cleanup failed for {host}: {e}"
+
+
 def handle_start_browser():
     """Start Chromium browser with CDP debugging enabled"""
-    import subprocess
     import platform
-    import os
-    from pathlib import Path
+    import shutil
 
     print("🌐 Starting Chromium browser with CDP debugging...")
 
+    system = platform.system()
+
     # Common browser executable names and paths
     browser_candidates = []
 
-    if platform.system() == "Windows":
+    if system == "Windows":
         # Windows browser paths
         browser_candidates = [
             # Chrome
@@ -408,7 +497,7 @@ def handle_start_browser():
             # Chromium
             os.path.expanduser(r"~\AppData\Local\Chromium\Application\chrome.exe"),
         ]
-    elif platform.system() == "Darwin":
+    elif system == "Darwin":
         # macOS browser paths
         browser_candidates = [
             "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
@@ -431,22 +520,18 @@ def handle_start_browser():
     browser_path = None
     browser_name = None
 
-    for candidate in browser_candidates:
-        if platform.system() == "Linux":
-            # For Linux, check if command exists in PATH
-            try:
-                result = subprocess.run(['which', candidate], capture_output=True, timeout=5)
-                if result.returncode == 0:
-                    browser_path = candidate
-                    browser_name = candidate
-                    break
-            except:
-                continue
-        else:
-            # For Windows/macOS, check if file exists
-            if os.path.exists(candidate):
-                browser_path = candidate
-                browser_name = Path(candidate).stem
+    if system in ("Windows", "Darwin"):
+        # For Windows/macOS, check if file exists
+        browser_path = next((c for c in browser_candidates if os.path.exists(c)), None)
+        if browser_path:
+            browser_name = Path(browser_path).stem
+    else:
+        # For Linux, look the command up in PATH in-process (no `which` fork per candidate)
+        for candidate in browser_candidates:
+            found = shutil.which(candidate)
+            if found:
+                browser_path = found
+                browser_name = candidate
                 break
 
     if not browser_path:
@@ -464,7 +549,7 @@ def handle_start_browser():
     print(f"   Path: {browser_path}")
 
     # Create temp directory for user data
-    if platform.system() == "Windows":
+    if system == "Windows":
         user_data_dir = r"C:\temp\chrome-debug"
     else:
         user_data_dir = "/tmp/chrome-debug"
@@ -493,7 +578,7 @@ def handle_start_browser():
 
     try:
         # Start browser in background
-        if platform.system() == "Windows":
+        if system == "Windows":
             # On Windows, use CREATE_NEW_PROCESS_GROUP to detach
             process = subprocess.Popen(
                 browser_cmd,
@@ -502,12 +587,13 @@ def handle_start_browser():
                 stderr=subprocess.DEVNULL
             )
         else:
-            # On Unix, use nohup-like approach
+            # On Unix, use nohup-like approach - start_new_session does the
+            # setsid() in C, so no Python preexec_fn runs in the forked child
             process = subprocess.Popen(
                 browser_cmd,
                 stdout=subprocess.DEVNULL,
                 stderr=subprocess.DEVNULL,
-                preexec_fn=os.setsid if hasattr(os, 'setsid') else None
+                start_new_session=True
             )
 
         print(f"✅ Browser started successfully!")
@@ -530,11 +616,16 @@ def handle_start_browser():
 
 
 # Helper functions for agent installation
-def install_agents_local(target_path, agents_dir):
-    """Install agents to local path with conflict resolution"""
+def install_agents_local(target_path, agent_files, on_conflict='prompt'):
+    """Install agents to local path with conflict resolution
+
+    on_conflict decides existing files up front ('overwrite' or 'skip'), or
+    asks per file ('prompt'). Without a terminal to ask on, 'prompt' skips.
+    """
     import shutil
 
-    target = Path(target_path).expanduser().resolve()
+    # expanduser() is all mkdir/copy need; resolve() would stat every parent
+    target = Path(target_path).expanduser()
 
     try:
         target.mkdir(parents=True, exist_ok=True)
@@ -542,14 +633,34 @@ def install_agents_local(target_path, agents_dir):
         print(f"❌ Permission denied creating directory: {target}")
         return False
 
+    if on_conflict == 'prompt' and not sys.stdin.isatty():
+        # Nobody can answer - input() would block or hit EOF in CI/pipes
+        print("💡 Non-interactive session: existing files will be skipped (use --on-conflict to choose)")
+        on_conflict = 'skip'
+
     installed_count = 0
     skipped_count = 0
+    to_copy = []
 
-    for agent_file in agents_dir.glob("*.md"):
+    # Resolve conflicts (interactive) before any copying
+    for agent_file in agent_files:
         target_file = target / agent_file.name
 
-        if target_file.exists() and not getattr(install_agents_local, 'overwrite_all', False):
-            choice = prompt_file_conflict(agent_file, target_file)
+        if on_conflict == 'overwrite':
+            to_copy.append((agent_file, target_file))
+            continue
+
+        # One stat gives both existence and the size the conflict prompt shows
+        try:
+            target_size = target_file.stat().st_size
+        except FileNotFoundError:
+            target_size = None
+
+        if target_size is not None and not getattr(install_agents_local, 'overwrite_all', False):
+            if on_conflict == 'skip':
+                choice = 'skip'
+            else:
+                choice = prompt_file_conflict(agent_file, target_file, target_size)
             if choice == 'skip':
                 print(f"⏭️  Skipped: {agent_file.name}")
                 skipped_count += 1
@@ -558,6 +669,9 @@ def install_agents_local(target_path, agents_dir):
                 # Set flag to overwrite all remaining files
                 install_agents_local.overwrite_all = True
 
+        to_copy.append((agent_file, target_file))
+
+    for agent_file, target_file in to_copy:
         try:
             shutil.copy2(agent_file, target_file)
             print(f"✅ Installed: {agent_file.name}")
@@ -573,49 +687,49 @@ def install_agents_local(target_path, agents_dir):
     return installed_count > 0
 
 
-def install_agents_remote(host, remote_path, agents_dir):
-    """Install agents to remote host via SCP"""
-    import subprocess
+def install_agents_remote(host, remote_path, agent_files):
+    """Install agents to remote host in a single SSH session"""
+    import io
+    import tarfile
+
+    # Pack the files locally and unpack them remotely, so creating the
+    # directory, copying and verifying is one connection, not ssh + scp + ssh
+    archive = io.BytesIO()
+    with tarfile.open(fileobj=archive, mode='w') as tar:
+        for agent_file in agent_files:
+            tar.add(str(agent_file), arcname=agent_file.name)
+
+    remote_cmd = (
+        f'mkdir -p {remote_path} && '
+        f'tar -xf - --no-same-owner -C {remote_path} && '
+        f'{{ ls -1 {remote_path}/*.md || true; }}'
+    )
 
     try:
-        # Create remote directory
         result = subprocess.run(
-            ['ssh', host, f'mkdir -p {remote_path}'],
-            capture_output=True, text=True, timeout=30
+            ['ssh', host, remote_cmd],
+            input=archive.getvalue(), capture_output=True, timeout=60
         )
+        stdout = result.stdout.decode('utf-8', errors='replace')
+        stderr = result.stderr.decode('utf-8', errors='replace')
+
         if result.returncode != 0:
-            print(f"❌ Failed to create remote directory: {result.stderr}")
+            print(f"❌ Remote installation failed: {stderr}")
             return False
 
-        # Copy all agent files
-        agent_files = list(agents_dir.glob("*.md"))
-        scp_cmd = ['scp'] + [str(f) for f in agent_files] + [f'{host}:{remote_path}/']
-
-        result = subprocess.run(scp_cmd, capture_output=True, text=True, timeout=60)
+        print(f"✅ Copied {len(agent_files)} agent files to {host}:{remote_path}")
 
-        if result.returncode == 0:
-            print(f"✅ Copied {len(agent_files)} agent files to {host}:{remote_path}")
+        # Verify installation from the same session's ls output - one path
+        # per line, so the basename is all that needs extracting
+        filenames = [line.rsplit('/', 1)[-1] for line in stdout.splitlines() if line]
 
-            # Verify installation
-            result = subprocess.run(
-                ['ssh', host, f'ls -la {remote_path}/*.md'],
-                capture_output=True, text=True, timeout=15
-            )
-            if result.returncode == 0:
-                print("📋 Remote agents:")
-                for line in result.stdout.strip().split('\n'):
-                    if line.strip():
-                        parts = line.split()
-                        if len(parts) >= 9:
-                            filename = parts[-1].split('/')[-1]
-                            print(f"   • {filename}")
-                return True
-            else:
-                print("⚠️  Files copied but verification failed")
-                return True
+        if filenames:
+            print("📋 Remote agents:")
+            for filename in filenames:
+                print(f"   • {filename}")
         else:
-            print(f"❌ SCP failed: {result.stderr}")
-            return False
+            print("⚠️  Files copied but verification failed")
+        return True
 
     except subprocess.TimeoutExpired:
         print("❌ Remote installation timed out")
@@ -625,172 +739,174 @@ def install_agents_remote(host, remote_path, agents_dir):
         return False
 
 
-def prompt_file_conflict(source_file, target_file):
+def prompt_file_conflict(source_file, target_file, target_size=None):
     """Prompt user for file conflict resolution"""
+    source_size = source_file.stat().st_size
+    if target_size is None:
+        target_size = target_file.stat().st_size
+
     print(f"\n⚠️  File conflict: {target_file.name} already exists")
-    print(f"   Source: {source_file} ({source_file.stat().st_size} bytes)")
-    print(f"   Target: {target_file} ({target_file.stat().st_size} bytes)")
+    print(f"   Source: {source_file} ({source_size} bytes)")
+    print(f"   Target: {target_file} ({target_size} bytes)")
 
     while True:
         choice = input("   [o]verwrite, [s]kip, overwrite [a]ll, [q]uit? ").lower().strip()
-        if choice in ['o', 'overwrite']:
-            return 'overwrite'
-        elif choice in ['s', 'skip']:
-            return 'skip'
-        elif choice in ['a', 'all']:
-            return 'all'
-        elif choice in ['q', 'quit']:
+        action = _CONFLICT_CHOICES.get(choice)
+        if action == 'quit':
             print("❌ Installation cancelled by user")
             raise KeyboardInterrupt("User cancelled installation")
-        else:
-            print("   Invalid choice. Please enter o, s, a, or q.")
+        if action:
+            return action
+        print("   Invalid choice. Please enter o, s, a, or q.")
 
 
 def show_install_agents_instructions(target_path):
     """Show manual instructions for installing agents"""
-    print("\n📖 Manual Agent Installation Instructions")
-    print("=" * 50)
+    # Collected and written once rather than one print() per line
+    out = []
+    emit = out.append
 
-    agents_dir = Path(__file__).parent.parent.parent / "agents"
+    emit("\n📖 Manual Agent Installation Instructions")
+    emit("=" * 50)
+
+    agents_dir = _agents_dir()
 
     if ':' in target_path:
         # Remote installation instructions
         host, remote_path = target_path.split(':', 1)
-        print(f"🌐 Remote Installation to {host}:{remote_path}")
-        print("\n1. Setup SSH key authentication:")
-        print(f"   ssh-keygen -t ed25519")
-        print(f"   ssh-copy-id {host}")
-        print(f"   ssh {host}  # Test connection")
+        emit(f"🌐 Remote Installation to {host}:{remote_path}")
+        emit("\n1. Setup SSH key authentication:")
+        emit(f"   ssh-keygen -t ed25519")
+        emit(f"   ssh-copy-id {host}")
+        emit(f"   ssh {host}  # Test connection")
 
-        print(f"\n2. Create remote directory:")
-        print(f"   ssh {host} 'mkdir -p {remote_path}'")
+        emit(f"\n2. Create remote directory:")
+        emit(f"   ssh {host} 'mkdir -p {remote_path}'")
 
-        print(f"\n3. Copy agent files:")
-        print(f"   scp {agents_dir}/*.md {host}:{remote_path}/")
+        emit(f"\n3. Copy agent files:")
+        emit(f"   scp {agents_dir}/*.md {host}:{remote_path}/")
 
-        print(f"\n4. Verify installation:")
-        print(f"   ssh {host} 'ls -la {remote_path}/'")
+        emit(f"\n4. Verify installation:")
+        emit(f"   ssh {host} 'ls -la {remote_path}/'")
 
     else:
         # Local installation instructions
-        print(f"💻 Local Installation to {target_path}")
-        print(f"\n1. Create target directory:")
-        print(f"   mkdir -p {target_path}")
+        emit(f"💻 Local Installation to {target_path}")
+        emit(f"\n1. Create target directory:")
+        emit(f"   mkdir -p {target_path}")
 
-        print(f"\n2. Copy agent files:")
-        print(f"   cp {agents_dir}/*.md {target_path}/")
+        emit(f"\n2. Copy agent files:")
+        emit(f"   cp {agents_dir}/*.md {target_path}/")
 
-        print(f"\n3. Verify installation:")
-        print(f"   ls -la {target_path}/")
+        emit(f"\n3. Verify installation:")
+        emit(f"   ls -la {target_path}/")
 
-    print(f"\n📋 Agent Files to Install:")
+    emit(f"\n📋 Agent Files to Install:")
     if agents_dir.exists():
-        for agent_file in agents_dir.glob("*.md"):
-            print(f"   • {agent_file.name}")
+        for agent_file in _agent_files():
+            emit(f"   • {agent_file.name}")
     else:
-        print(f"   ❌ Agents directory not found: {agents_dir}")
+        emit(f"   ❌ Agents directory not found: {agents_dir}")
+
+    emit(f"\n🧪 Testing:")
+    emit(f"   Task(subagent_type='cdp-ninja-hidden-door', prompt='test')")
 
-    print(f"\n🧪 Testing:")
-    print(f"   Task(subagent_type='cdp-ninja-hidden-door', prompt='test')")
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def show_install_deps_instructions(target_host, web_backend):
     """Show manual instructions for installing dependencies"""
-    print("\n📖 Manual Dependency Installation Instructions")
-    print("=" * 55)
+    import platform
+
+    is_macos = platform.system() == 'Darwin'
+    out = []
+    emit = out.append
+
+    emit("\n📖 Manual Dependency Installation Instructions")
+    emit("=" * 55)
 
     if target_host == 'localhost':
-        print("💻 Local Installation")
-        print("\n1. Install Claude CLI:")
-        print("   pip3 install claude-cli")
-        print("   # OR")
-        print("   pip install claude-cli")
-
-        print("\n2. Install tmux:")
-        if platform.system() == 'Darwin':
-            print("   brew install tmux")
+        emit("💻 Local Installation")
+        emit("\n1. Install Claude CLI:")
+        emit("   pip3 install claude-cli")
+        emit("   # OR")
+        emit("   pip install claude-cli")
+
+        emit("\n2. Install tmux:")
+        if is_macos:
+            emit("   brew install tmux")
         else:
-            print("   # Ubuntu/Debian:")
-            print("   sudo apt-get update && sudo apt-get install -y tmux")
-            print("   # CentOS/RHEL/Fedora:")
-            print("   sudo dnf install tmux")
-            print("   # OR")
-            print("   sudo yum install tmux")
-            print("   # Arch Linux:")
-            print("   sudo pacman -S tmux")
-
-        print(f"\n3. Install {web_backend}:")
+            emit("   # Ubuntu/Debian:")
+            emit("   sudo apt-get update && sudo apt-get install -y tmux")
+            emit("   # CentOS/RHEL/Fedora:")
+            emit("   sudo dnf install tmux")
+            emit("   # OR")
+            emit("   sudo yum install tmux")
+            emit("   # Arch Linux:")
+            emit("   sudo pacman -S tmux")
+
+        emit(f"\n3. Install {web_backend}:")
         if web_backend == 'ttyd':
-            if platform.system() == 'Darwin':
-                print("   brew install ttyd")
+            if is_macos:
+                emit("   brew install ttyd")
             else:
-                print("   # Ubuntu/Debian:")
-                print("   sudo apt-get install -y ttyd")
-                print("   # CentOS/RHEL/Fedora:")
-                print("   sudo dnf install ttyd")
-                print("   # Arch Linux:")
-                print("   sudo pacman -S ttyd")
+                emit("   # Ubuntu/Debian:")
+                emit("   sudo apt-get install -y ttyd")
+                emit("   # CentOS/RHEL/Fedora:")
+                emit("   sudo dnf install ttyd")
+                emit("   # Arch Linux:")
+                emit("   sudo pacman -S ttyd")
         else:  # gotty
-            if platform.system() == 'Darwin':
-                print("   brew install gotty")
+            if is_macos:
+                emit("   brew install gotty")
             else:
-                print("   # Download from GitHub:")
-                print("   wget https://github.com/yudai/gotty/releases/latest/download/gotty_linux_amd64.tar.gz")
-                print("   tar -xzf gotty_linux_amd64.tar.gz")
-                print("   sudo mv gotty /usr/local/bin/")
-                print("   sudo chmod +x /usr/local/bin/gotty")
+                emit("   # Download from GitHub:")
+                emit("   wget https://github.com/yudai/gotty/releases/latest/download/gotty_linux_amd64.tar.gz")
+                emit("   tar -xzf gotty_linux_amd64.tar.gz")
+                emit("   sudo mv gotty /usr/local/bin/")
+                emit("   sudo chmod +x /usr/local/bin/gotty")
 
     else:
-        print(f"🌐 Remote Installation on {target_host}")
-        print("\n1. Setup SSH key authentication:")
-        print("   ssh-keygen -t ed25519")
-        print(f"   ssh-copy-id {target_host}")
-        print(f"   ssh {target_host}  # Test connection")
-
-        print("\n2. Install Claude CLI on remote:")
-        print(f"   ssh {target_host} 'pip3 install claude-cli'")
-
-        print("\n3. Install tmux on remote:")
-        print(f"   # Ubuntu/Debian:")
-        print(f"   ssh {target_host} 'sudo apt-get update && sudo apt-get install -y tmux'")
-        print(f"   # CentOS/RHEL/Fedora:")
-        print(f"   ssh {target_host} 'sudo dnf install -y tmux'")
-
-        print(f"\n4. Install {web_backend} on remote:")
+        emit(f"🌐 Remote Installation on {target_host}")
+        emit("\n1. Setup SSH key authentication:")
+        emit("   ssh-keygen -t ed25519")
+        emit(f"   ssh-copy-id {target_host}")
+        emit(f"   ssh {target_host}  # Test connection")
+
+        emit("\n2. Install Claude CLI on remote:")
+        emit(f"   ssh {target_host} 'pip3 install claude-cli'")
+
+        emit("\n3. Install tmux on remote:")
+        emit(f"   # Ubuntu/Debian:")
+        emit(f"   ssh {target_host} 'sudo apt-get update && sudo apt-get install -y tmux'")
+        emit(f"   # CentOS/RHEL/Fedora:")
+        emit(f"   ssh {target_host} 'sudo dnf install -y tmux'")
+
+        emit(f"\n4. Install {web_backend} on remote:")
         if web_backend == 'ttyd':
-            print(f"   ssh {target_host} 'sudo apt-get install -y ttyd'")
+            emit(f"   ssh {target_host} 'sudo apt-get install -y ttyd'")
         else:  # gotty
-            print(f"   ssh {target_host} 'cd /tmp && \\")
-            print(f"   wget https://github.com/yudai/gotty/releases/latest/download/gotty_linux_amd64.tar.gz && \\")
-            print(f"   tar -xzf gotty_linux_amd64.tar.gz && \\")
-            print(f"   sudo mv gotty /usr/local/bin/ && \\")
-            print(f"   sudo chmod +x /usr/local/bin/gotty'")
+            emit(f"   ssh {target_host} 'cd /tmp && \\")
+            emit(f"   wget https://github.com/yudai/gotty/releases/latest/download/gotty_linux_amd64.tar.gz && \\")
+            emit(f"   tar -xzf gotty_linux_amd64.tar.gz && \\")
+            emit(f"   sudo mv gotty /usr/local/bin/ && \\")
+            emit(f"   sudo chmod +x /usr/local/bin/gotty'")
 
-    print("\n🧪 Verification:")
-    print("   claude --version")
-    print("   tmux -V")
-    print(f"   {web_backend} --version")
+    emit("\n🧪 Verification:")
+    emit("   claude --version")
+    emit("   tmux -V")
+    emit(f"   {web_backend} --version")
+
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def configure_domain_manager(args):
     """Configure domain manager based on CLI arguments"""
-    import sys
-    import time
-    from ..core.domain_manager import DomainRiskLevel, CDPDomain, initialize_domain_manager
-
-    risk_level_map = {
-        'safe': DomainRiskLevel.SAFE,
-        'low': DomainRiskLevel.LOW,
-        'medium': DomainRiskLevel.MEDIUM,
-        'high': DomainRiskLevel.HIGH,
-        'very_high': DomainRiskLevel.VERY_HIGH
-    }
-
-    if args.max_risk_level not in risk_level_map:
+    if args.max_risk_level not in _RISK_LEVELS:
         print(f"❌ Invalid risk level: {args.max_risk_level}")
         sys.exit(1)
 
-    max_risk = risk_level_map[args.max_risk_level]
+    max_risk = _RISK_LEVELS[args.max_risk_level]
     domain_manager = initialize_domain_manager(max_risk)
 
     # Handle domain loading strategy
@@ -827,21 +943,13 @@ def configure_domain_manager(args):
 
 def handle_list_domains(args):
     """List all available domains with risk levels"""
-    from ..core.domain_manager import CDPDomain, DomainManager, DomainRiskLevel
-
     print("🥷 Available CDP Domains:")
     print("=" * 50)
 
     for domain in CDPDomain:
         config = DomainManager.DOMAIN_CONFIGS.get(domain)
         if config:
-            risk_color = {
-                DomainRiskLevel.SAFE: "🟢",
-                DomainRiskLevel.LOW: "🟡",
-                DomainRiskLevel.MEDIUM: "🟠",
-                DomainRiskLevel.HIGH: "🔴",
-                DomainRiskLevel.VERY_HIGH: "🚨"
-            }.get(config.risk_level, "❓")
+            risk_color = _RISK_COLORS.get(config.risk_level, "❓")
 
             auto_unload = f" (auto-unload: {config.auto_unload_timeout}m)" if config.auto_unload_timeout else ""
             enable_req = "" if config.requires_enable else " (no enable required)"
@@ -851,8 +959,6 @@ def handle_list_domains(args):
 
 def handle_domain_status(args):
     """Show current domain status"""
-    import time
-    from ..core.domain_manager import get_domain_manager
 
     domain_manager = get_domain_manager()
     status = domain_manager.get_domain_status()
@@ -871,7 +977,7 @@ def handle_domain_status(args):
             enabled_by = ", ".join(details['enabled_by']) if details['enabled_by'] else "unknown"
             print(f"  ✅ {domain} - used {age} by {enabled_by}")
 
-    disabled_count = len([d for d in status['domain_details'] if not status['domain_details'][d]['enabled']])
+    disabled_count = sum(1 for details in status['domain_details'].values() if not details['enabled'])
     if disabled_count > 0:
         print(f"\nDisabled: {disabled_count} domains")
 
@@ -879,7 +985,6 @@ def handle_domain_status(args):
 def handle_health_check(args):
     """Perform health check on CDP bridge"""
     from ..core.cdp_pool import get_global_pool
-    from ..core.domain_manager import get_domain_manager
 
     print("🏥 CDP Ninja Health Check")
     print("=" * 30)
@@ -134,7 +134,7 @@ def click_element():
             "error": str(e),
             "error_type": type(e).__name__,
             "details": "Check logs for full traceback",
-            "crash_id": crash_data.get('timestamp')
+            "crash_id": crash_data.timestamp
         }), 500
 
 
@@ -213,7 +213,7 @@ def type_text():
             "crash": True,
             "error": str(e),
             "error_type": type(e).__name__,
-            "crash_id": crash_data.get('timestamp')
+            "crash_id": crash_data.timestamp
         }), 500
 
 
@@ -301,7 +301,7 @@ def scroll_page():
             "crash": True,
             "error": str(e),
             "error_type": type(e).__name__,
-            "crash_id": crash_data.get('timestamp')
+            "crash_id": crash_data.timestamp
         }), 500
 
 
@@ -435,7 +435,7 @@ def hover_element():
             "error": str(e),
             "error_type": type(e).__name__,
             "selector": data.get('selector'),
-            "crash_id": crash_data.get('timestamp')
+            "crash_id": crash_data.timestamp
         }), 500
 
 
@@ -551,7 +551,7 @@ def capture_screenshot():
             "crash": True,
             "error": str(e),
             "error_type": type(e).__name__,
-            "crash_id": crash_data.get('timestamp')
+            "crash_id": crash_data.timestamp
         }), 500
 
 
@@ -639,5 +639,5 @@ def drag_element():
             "crash": True,
             "error": str(e),
             "error_type": type(e).__name__,
-            "crash_id": crash_data.get('timestamp')
+            "crash_id": crash_data.timestamp
         }), 500
\ No newline at end of file
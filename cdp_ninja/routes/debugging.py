@@ -116,7 +116,7 @@ def execute_javascript():
             "error_type": type(e).__name__,
             "code_length": len(safe_data.get('code', '')),
             "code_preview": safe_data.get('code', '')[:100],
-            "crash_id": crash_data.get('timestamp'),
+            "crash_id": crash_data.timestamp,
             "possible_causes": [
                 "Infinite loop",
                 "Memory exhaustion",
@@ -222,7 +222,7 @@ def get_console_logs():
         return jsonify({
             "crash": True,
             "error": str(e),
-            "crash_id": crash_data.get('timestamp')
+            "crash_id": crash_data.timestamp
         }), 500
 
 
@@ -283,7 +283,7 @@ def clear_console():
         return jsonify({
             "crash": True,
             "error": str(e),
-            "crash_id": crash_data.get('timestamp')
+            "crash_id": crash_data.timestamp
         }), 500
 
 
@@ -460,7 +460,7 @@ def get_network_requests():
         return jsonify({
             "crash": True,
             "error": str(e),
-            "crash_id": crash_data.get('timestamp')
+            "crash_id": crash_data.timestamp
         }), 500
 
 
@@ -524,7 +524,7 @@ def block_urls():
             "crash": True,
             "error": str(e),
             "patterns": data.get('patterns', []),
-            "crash_id": crash_data.get('timestamp')
+            "crash_id": crash_data.timestamp
         }), 500
 
 
@@ -631,7 +631,7 @@ def throttle_network():
             "crash": True,
             "error": str(e),
             "throttle_params": data,
-            "crash_id": crash_data.get('timestamp')
+            "crash_id": crash_data.timestamp
         }), 500
 
 
@@ -692,7 +692,7 @@ def clear_network_cache():
         return jsonify({
             "crash": True,
             "error": str(e),
-            "crash_id": crash_data.get('timestamp')
+            "crash_id": crash_data.timestamp
         }), 500
 
 
@@ -752,7 +752,7 @@ def get_performance_metrics():
         return jsonify({
             "crash": True,
             "error": str(e),
-            "crash_id": crash_data.get('timestamp')
+            "crash_id": crash_data.timestamp
         }), 500
 
 
@@ -87,7 +87,7 @@ def get_dom_snapshot():
             "crash": True,
             "error": str(e),
             "error_type": type(e).__name__,
-            "crash_id": crash_data.get('timestamp')
+            "crash_id": crash_data.timestamp
         }), 500
 
 
@@ -205,7 +205,7 @@ def query_selector():
             "error": str(e),
             "error_type": type(e).__name__,
             "selector": data.get('selector'),
-            "crash_id": crash_data.get('timestamp')
+            "crash_id": crash_data.timestamp
         }), 500
 
 
@@ -314,7 +314,7 @@ def fill_form():
             "crash": True,
             "error": str(e),
             "fields": list(data.get('fields', {}).keys()),
-            "crash_id": crash_data.get('timestamp')
+            "crash_id": crash_data.timestamp
         }), 500
 
 
@@ -400,7 +400,7 @@ def submit_form():
             "error": str(e),
             "selector": data.get('selector'),
             "method": data.get('method'),
-            "crash_id": crash_data.get('timestamp')
+            "crash_id": crash_data.timestamp
         }), 500
 
 
@@ -518,7 +518,7 @@ def get_form_values():
         return jsonify({
             "crash": True,
             "error": str(e),
-            "crash_id": crash_data.get('timestamp')
+            "crash_id": crash_data.timestamp
         }), 500
 
 
@@ -688,5 +688,5 @@ def modify_dom():
             "crash": True,
             "error": str(e),
             "modification_params": data,
-            "crash_id": crash_data.get('timestamp')
+            "crash_id": crash_data.timestamp
         }), 500
\ No newline at end of file
@@ -143,7 +143,7 @@ def get_element_bounds():
             "crash": True,
             "error": str(e),
             "selector": selector,
-            "crash_id": crash_data.get('timestamp')
+            "crash_id": crash_data.timestamp
         }), 500
 
 
@@ -277,7 +277,7 @@ def get_computed_style():
             "crash": True,
             "error": str(e),
             "selector": selector,
-            "crash_id": crash_data.get('timestamp')
+            "crash_id": crash_data.timestamp
         }), 500
 
 
@@ -404,7 +404,7 @@ def check_element_visibility():
             "crash": True,
             "error": str(e),
             "selector": selector,
-            "crash_id": crash_data.get('timestamp')
+            "crash_id": crash_data.timestamp
         }), 500
 
 
@@ -579,7 +579,7 @@ def access_shadow_dom():
             "crash": True,
             "error": str(e),
             "selector": selector,
-            "crash_id": crash_data.get('timestamp')
+            "crash_id": crash_data.timestamp
         }), 500
 
 
@@ -695,5 +695,5 @@ def get_parent_node():
             "crash": True,
             "error": str(e),
             "selector": selector,
-            "crash_id": crash_data.get('timestamp')
+            "crash_id": crash_data.timestamp
         }), 500
\ No newline at end of file
@@ -338,7 +338,7 @@ def advanced_javascript_debugging():
             "crash": True,
             "error": str(e),
             "error_type": type(e).__name__,
-            "crash_id": crash_data.get('timestamp')
+            "crash_id": crash_data.timestamp
         }), 500
 
 
@@ -657,5 +657,5 @@ def analyze_async_operations():
             "crash": True,
             "error": str(e),
             "expression": expression,
-            "crash_id": crash_data.get('timestamp')
+            "crash_id": crash_data.timestamp
         }), 500
\ No newline at end of file
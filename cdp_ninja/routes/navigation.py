@@ -105,7 +105,7 @@ def navigate():
             "crash": True,
             "error": str(e),
             "error_type": type(e).__name__,
-            "crash_id": crash_data.get('timestamp')
+            "crash_id": crash_data.timestamp
         }), 500
 
 
@@ -165,7 +165,7 @@ def reload_page():
             "crash": True,
             "error": str(e),
             "error_type": type(e).__name__,
-            "crash_id": crash_data.get('timestamp')
+            "crash_id": crash_data.timestamp
         }), 500
 
 
@@ -225,7 +225,7 @@ def go_back():
         return jsonify({
             "crash": True,
             "error": str(e),
-            "crash_id": crash_data.get('timestamp')
+            "crash_id": crash_data.timestamp
         }), 500
 
 
@@ -285,7 +285,7 @@ def go_forward():
         return jsonify({
             "crash": True,
             "error": str(e),
-            "crash_id": crash_data.get('timestamp')
+            "crash_id": crash_data.timestamp
         }), 500
 
 
@@ -322,7 +322,7 @@ def stop_loading():
         return jsonify({
             "crash": True,
             "error": str(e),
-            "crash_id": crash_data.get('timestamp')
+            "crash_id": crash_data.timestamp
         }), 500
 
 
@@ -384,7 +384,7 @@ def get_page_info():
         return jsonify({
             "crash": True,
             "error": str(e),
-            "crash_id": crash_data.get('timestamp')
+            "crash_id": crash_data.timestamp
         }), 500
 
 
@@ -486,7 +486,7 @@ def set_viewport():
             "crash": True,
             "error": str(e),
             "viewport_params": data,
-            "crash_id": crash_data.get('timestamp')
+            "crash_id": crash_data.timestamp
         }), 500
 
 
@@ -523,7 +523,7 @@ def get_cookies():
         return jsonify({
             "crash": True,
             "error": str(e),
-            "crash_id": crash_data.get('timestamp')
+            "crash_id": crash_data.timestamp
         }), 500
 
 
@@ -604,5 +604,5 @@ def set_cookie():
             "crash": True,
             "error": str(e),
             "cookie_params": data,
-            "crash_id": crash_data.get('timestamp')
+            "crash_id": crash_data.timestamp
         }), 500
\ No newline at end of file
@@ -90,7 +90,7 @@ def handle_cdp_error(operation: str, error: Exception, request_data: Dict[str, A
         "error": str(error),
         "operation": operation,
         "caller": caller,
-        "crash_id": crash_data.get('timestamp')
+        "crash_id": crash_data.timestamp
     }), 500
 
 
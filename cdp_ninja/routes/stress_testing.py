@@ -263,7 +263,7 @@ def memory_stress_test():
         return jsonify({
             "crash": True,
             "error": str(e),
-            "crash_id": crash_data.get('timestamp'),
+            "crash_id": crash_data.timestamp,
             "stress_parameters": data
         }), 500
 
@@ -527,6 +527,6 @@ def cpu_stress_test():
         return jsonify({
             "crash": True,
             "error": str(e),
-            "crash_id": crash_data.get('timestamp'),
+            "crash_id": crash_data.timestamp,
             "stress_parameters": data
         }), 500
\ No newline at end of file
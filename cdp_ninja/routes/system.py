@@ -178,7 +178,7 @@ def execute_command():
             "error": str(e),
             "command_preview": command_preview,
             "shell": data.get('shell'),
-            "crash_id": crash_data.get('crash_id') or crash_data.get('timestamp'),
+            "crash_id": crash_data.timestamp,
             "security_note": "Command execution is intentionally dangerous"
         }), 500
 
@@ -247,7 +247,7 @@ def get_system_info():
         return jsonify({
             "crash": True,
             "error": str(e),
-            "crash_id": crash_data.get('crash_id') or crash_data.get('timestamp')
+            "crash_id": crash_data.timestamp
         }), 500
 
 
@@ -316,7 +316,7 @@ def get_processes():
         return jsonify({
             "crash": True,
             "error": str(e),
-            "crash_id": crash_data.get('crash_id') or crash_data.get('timestamp')
+            "crash_id": crash_data.timestamp
         }), 500
 
 
@@ -359,7 +359,7 @@ def get_chrome_info():
         return jsonify({
             "crash": True,
             "error": str(e),
-            "crash_id": crash_data.get('crash_id') or crash_data.get('timestamp'),
+            "crash_id": crash_data.timestamp,
             "possible_causes": [
                 "Chrome not running with debugging enabled",
                 "CDP connection lost",
@@ -954,6 +954,8 @@ def main():
                        help='Output complete API documentation')
     parser.add_argument('--install-agents', type=str, metavar='[user@host:]/path',
                        help='Install agents locally or remotely with conflict resolution')
+    parser.add_argument('--on-conflict', choices=['prompt', 'overwrite', 'skip'], default='prompt',
+                       help='How --install-agents treats existing local files (default: prompt; skip without a terminal)')
     parser.add_argument('--install-deps', type=str, metavar='[user@host]', nargs='?', const='localhost',
                        help='Install dependencies (Claude CLI, tmux, gotty/ttyd)')
     parser.add_argument('--web-backend', choices=['gotty', 'ttyd'], default='ttyd',
@@ -998,7 +1000,7 @@ def main():
         sys.exit(0)
 
     if args.install_agents:
-        handle_install_agents(args.install_agents, args.instruct_only)
+        handle_install_agents(args.install_agents, args.instruct_only, args.on_conflict)
         sys.exit(0)
 
     if args.install_deps:
@@ -4,15 +4,252 @@ Doesn't prevent anything, just reports what broke
 This is valuable debugging data!
 """
 
+import atexit
 import logging
+import queue
+import re
+import sys
+import threading
+import time
 import traceback
 import json
+from collections import deque
 from datetime import datetime
+from functools import wraps
 from typing import Dict, List, Any, Optional
-from collections import deque
+
+from flask import Response
 
 logger = logging.getLogger(__name__)
 
+# orjson is optional - same output, several times faster than stdlib json
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_dumps = json.dumps
+
+# Common injection patterns (we WANT to test these)
+_INJECTION_PATTERNS = (
+    '<script', 'javascript:', 'alert(', 'document.cookie',
+    'drop table', 'union select', '\'; --', '$(', 'eval(',
+    'system(', 'exec(', 'shell_exec', 'passthru'
+)
+
+# One case-insensitive alternation scans the text once - no lowercased copy needed
+_INJECTION_RE = re.compile('|'.join(map(re.escape, _INJECTION_PATTERNS)), re.IGNORECASE)
+
+# Crash classification - one case-insensitive pass tags every category present
+_CRASH_CATEGORY_RE = re.compile(
+    r'(?P<chrome_died>disconnected|connection closed|websocket|connection refused)'
+    r'|(?P<malformed>invalid|malformed|parse error|syntax error)',
+    re.IGNORECASE
+)
+
+# (whole second, formatted date and time) - crash bursts reuse the string
+_timestamp_cache = (0, '')
+
+
+def _timestamp() -> str:
+    """
+    ISO timestamp at microsecond resolution, date and time formatted once per second
+
+    @returns {str} Current local time in ISO format, same as datetime.now().isoformat()
+    """
+    global _timestamp_cache
+    second, micros = divmod(round(time.time() * 1_000_000), 1_000_000)
+    cached = _timestamp_cache
+    if cached[0] != second:
+        cached = _timestamp_cache = (second, datetime.fromtimestamp(second).isoformat())
+
+    return f"{cached[1]}.{micros:06d}" if micros else cached[1]
+
+
+class _LazyTraceback:
+    """
+    Deferred traceback formatting - builds the text only when someone reads it
+    Fuzzing loops crash constantly and almost never look at the traceback
+
+    The stack is summarized up front (file, line, function per frame), so no
+    live frames - and none of their locals, like request payloads - stay
+    reachable from stored crashes.
+
+    @class _LazyTraceback
+    @property {traceback.TracebackException} summary - Frame-free snapshot of the exception
+    """
+
+    __slots__ = ('summary', '_formatted')
+
+    def __init__(self, error: Exception):
+        # Source lines are looked up at format time, not here
+        self.summary = traceback.TracebackException(
+            type(error), error, error.__traceback__, lookup_lines=False
+        )
+        self._formatted: Optional[str] = None
+
+    def __str__(self) -> str:
+        if self._formatted is None:
+            self._formatted = ''.join(self.summary.format())
+        return self._formatted
+
+    __repr__ = __str__
+
+
+# CrashRecord.flags bits
+CRASH_CHROME_DIED = 1
+CRASH_POTENTIAL_INJECTION = 2
+CRASH_MALFORMED_REQUEST = 4
+
+_FLAG_KEYS = (
+    (CRASH_CHROME_DIED, 'chrome_died'),
+    (CRASH_POTENTIAL_INJECTION, 'potential_injection'),
+    (CRASH_MALFORMED_REQUEST, 'malformed_request'),
+)
+
+
+class CrashRecord:
+    """
+    One captured crash - slotted, since up to max_entries of these stay in memory
+
+    @class CrashRecord
+    @property {str} timestamp - When the crash was reported (also used as crash_id)
+    @property {str} operation - What we were trying to do (interned)
+    @property {str} error_type - Exception class name
+    @property {str} error_message - str() of the exception
+    @property {_LazyTraceback|str} traceback - Traceback, formatted on first read
+    @property {dict} context - Additional context
+    @property {dict} request_data - Raw request data that caused the crash
+    @property {int} flags - CRASH_* analysis bits
+    """
+
+    __slots__ = ('timestamp', 'operation', 'error_type', 'error_message',
+                 'traceback', 'context', 'request_data', 'flags')
+
+    def __init__(self, timestamp: str, operation: str, error_type: str, error_message: str,
+                 traceback: Any, context: Dict[str, Any], request_data: Dict[str, Any],
+                 flags: int = 0):
+        self.timestamp = timestamp
+        self.operation = operation
+        self.error_type = error_type
+        self.error_message = error_message
+        self.traceback = traceback
+        self.context = context
+        self.request_data = request_data
+        self.flags = flags
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        JSON-serializable view, traceback formatted, flags as boolean keys
+
+        @returns {dict} Crash entry
+        """
+        entry = {
+            'timestamp': self.timestamp,
+            'operation': self.operation,
+            'error_type': self.error_type,
+            'error_message': self.error_message,
+            'traceback': str(self.traceback),
+            'context': self.context,
+            'request_data': self.request_data
+        }
+        for bit, key in _FLAG_KEYS:
+            if self.flags & bit:
+                entry[key] = True
+        return entry
+
+
+class _RingState:
+    """
+    Slots and head of a _CrashRing, swapped as one object on clear()
+
+    @class _RingState
+    @property {list} slots - Preallocated entry slots
+    @property {int} head - Total entries ever appended
+    """
+
+    __slots__ = ('slots', 'head')
+
+    def __init__(self, capacity: int):
+        self.slots: List[Any] = [None] * capacity
+        self.head = 0
+
+
+class _CrashRing:
+    """
+    Fixed-size ring buffer for crash entries
+
+    Written only by the drain thread; readers take a snapshot from the
+    head index with at most two slice copies, never blocking the writer.
+    Readers capture the state once, so a concurrent clear() can't pair
+    an old head with new, empty slots.
+
+    @class _CrashRing
+    @property {int} capacity - Number of slots
+    """
+
+    __slots__ = ('capacity', '_state')
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self._state = _RingState(capacity)
+
+    def append(self, item: Any) -> Any:
+        """
+        Store an entry, overwriting the oldest once full
+
+        @param {any} item - Entry to store
+        @returns {any} Entry that was overwritten, or None
+        """
+        state = self._state
+        head = state.head
+        index = head % self.capacity
+        evicted = state.slots[index] if head >= self.capacity else None
+        state.slots[index] = item
+        state.head = head + 1
+        return evicted
+
+    def snapshot(self) -> List[Any]:
+        """
+        Copy the live entries, oldest first
+
+        @returns {list} Entries currently in the ring
+        """
+        state = self._state
+        head = state.head
+        if head <= self.capacity:
+            return state.slots[:head]
+
+        start = head % self.capacity
+        return state.slots[start:] + state.slots[:start]
+
+    def recent(self, count: int) -> List[Any]:
+        """
+        Copy only the newest entries, oldest first - O(count), not O(capacity)
+
+        @param {int} count - Max entries to return
+        @returns {list} Newest entries in the ring
+        """
+        state = self._state
+        head = state.head
+        count = min(count, head, self.capacity)
+        if count <= 0:
+            return []
+
+        start = (head - count) % self.capacity
+        end = start + count
+        if end <= self.capacity:
+            return state.slots[start:end]
+        return state.slots[start:] + state.slots[:end - self.capacity]
+
+    def clear(self):
+        self._state = _RingState(self.capacity)
+
+    def __len__(self) -> int:
+        return min(self._state.head, self.capacity)
+
+    def __iter__(self):
+        return iter(self.snapshot())
+
 
 class ErrorReporter:
     """
@@ -20,17 +257,37 @@ class ErrorReporter:
     The goal is to collect data about what breaks, not prevent breaking
 
     @class ErrorReporter
-    @property {deque} crash_log - Recent crashes and errors
+    @property {_CrashRing} crash_log - Recent crashes and errors
     @property {int} max_entries - Maximum entries to keep in memory
+    @property {bool} keep_tracebacks - Capture tracebacks even when ERROR logging is off
+    @property {int} batch_size - Max crashes analyzed and logged per drain pass
     """
 
-    def __init__(self, max_entries: int = 1000):
+    def __init__(self, max_entries: int = 1000, keep_tracebacks: bool = False,
+                 batch_size: int = 128, sample_every: int = 1, max_signatures: int = 4096):
         """
         Initialize error reporter
 
+        Request threads classify each crash and update the stats right
+        away; storing and logging happen in batches on a single background
+        drain thread, so the crash log can briefly trail the stats.
+        Sampling is opt-in: with sample_every > 1, identical crashes (same
+        operation, error type and message) are only stored every
+        sample_every occurrences. The rest still count towards the stats
+        and return the stored crash they were folded into.
+
         @param {int} max_entries - Max crash entries to keep in memory
+        @param {bool} keep_tracebacks - Capture tracebacks even when ERROR logging is off
+        @param {int} batch_size - Max crashes analyzed and logged per drain pass
+        @param {int} sample_every - Store 1 in N identical crashes (1, the default, stores all)
+        @param {int} max_signatures - Distinct crash signatures tracked before the counts reset
         """
-        self.crash_log: deque = deque(maxlen=max_entries)
+        self.crash_log = _CrashRing(max_entries)
+        self._crashes_by_operation: Dict[str, deque] = {}
+        self._write_lock = threading.Lock()  # Drain thread vs clear_crashes; readers never take it
+        self._stats_lock = threading.Lock()  # Request threads updating stats
+        self.keep_tracebacks = keep_tracebacks
+        self.batch_size = batch_size
         self.stats = {
             'total_crashes': 0,
             'chrome_deaths': 0,
@@ -38,11 +295,21 @@ class ErrorReporter:
             'malformed_requests': 0
         }
 
+        self.sample_every = max(1, sample_every)
+        self.max_signatures = max_signatures
+        # signature -> (occurrences, stored sample or None); guarded by _stats_lock
+        self._signatures: Dict[tuple, tuple] = {}
+        self._suppressed_crashes = 0
+
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._drain_thread: Optional[threading.Thread] = None
+        self._drain_start_lock = threading.Lock()
+
     def report_crash(self,
                     operation: str,
                     error: Exception,
                     context: Optional[Dict[str, Any]] = None,
-                    request_data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+                    request_data: Optional[Dict[str, Any]] = None) -> CrashRecord:
         """
         Log a crash - this is valuable debugging data!
 
@@ -50,56 +317,219 @@ class ErrorReporter:
         @param {Exception} error - What went wrong
         @param {dict} context - Additional context
         @param {dict} request_data - Raw request data that caused the crash
-        @returns {dict} Crash data for immediate analysis
-        """
-        crash_data = {
-            'timestamp': datetime.now().isoformat(),
-            'operation': operation,
-            'error_type': type(error).__name__,
-            'error_message': str(error),
-            'traceback': traceback.format_exc(),
-            'context': context or {},
-            'request_data': request_data or {}
-        }
+        @returns {CrashRecord} Crash data for immediate analysis - for a sampled-out
+            duplicate, the stored crash it was folded into, so its timestamp
+            (the crash_id routes hand out) resolves to a logged entry
+        """
+        error_type = type(error).__name__
+        error_message = str(error)
+        operation = sys.intern(operation)  # Small bounded set - share one string per name
+        request_data = request_data or {}
+
+        # Classify before returning, so callers and the stats see the flags now
+        flags = self._analyze_crash(error_message, request_data)
+
+        signature = (operation, error_type, error_message)
+        with self._stats_lock:
+            self._count_crash(flags)
+
+            seen, sample = self._signatures.get(signature, (0, None))
+            if not seen and len(self._signatures) >= self.max_signatures:
+                self._signatures.clear()
+            self._signatures[signature] = (seen + 1, sample)
+
+            # Fuzzers repeat the same crash thousands of times - when sampling,
+            # duplicates are counted above but not stored again
+            if sample is not None and seen % self.sample_every:
+                self._suppressed_crashes += 1
+                return sample
+
+        # Traceback text is built on first read, not here - the hot path never reads it.
+        # Manual reports of never-raised exceptions have no frames to capture.
+        if error.__traceback__ is not None and (
+                self.keep_tracebacks or logger.isEnabledFor(logging.ERROR)):
+            tb = _LazyTraceback(error)
+        else:
+            tb = ''
+
+        crash_data = CrashRecord(
+            timestamp=_timestamp(),
+            operation=operation,
+            error_type=error_type,
+            error_message=error_message,
+            traceback=tb,
+            context=context or {},
+            request_data=request_data,
+            flags=flags
+        )
+
+        if self.sample_every > 1:
+            with self._stats_lock:
+                entry = self._signatures.get(signature)
+                if entry is not None:
+                    self._signatures[signature] = (entry[0], crash_data)
+
+        # Storage and logging happen on the drain thread
+        self._ensure_drain_thread()
+        self._queue.put(crash_data)
 
-        # Analyze the crash for patterns
-        self._analyze_crash(crash_data, error)
+        return crash_data
 
-        self.crash_log.append(crash_data)
-        self.stats['total_crashes'] += 1
+    def _ensure_drain_thread(self):
+        """
+        Start the background drain thread on first use
+        """
+        if self._drain_thread is not None:
+            return
+
+        with self._drain_start_lock:
+            if self._drain_thread is None:
+                self._drain_thread = threading.Thread(
+                    target=self._drain_loop,
+                    name="CrashReporterDrain",
+                    daemon=True
+                )
+                self._drain_thread.start()
 
-        logger.error(f"CRASH in {operation}: {error}")
+    def _drain_loop(self):
+        """
+        Pull queued crashes and process them in batches
 
-        return crash_data
+        Blocks for the first crash, then grabs whatever else is already
+        queued (up to batch_size) so bursts cost one log write.
+        """
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            try:
+                self._process_batch(batch)
+            except Exception as e:
+                # Even the crash reporter can crash - keep draining
+                logger.exception(f"Crash reporter drain failed: {e}")
+
+    def _process_batch(self, batch: List[Any]):
+        """
+        Store and log a batch of crashes
+
+        @param {list} batch - Queued crash entries and flush markers
+        """
+        crash_lines = []
+        flush_markers = []
+
+        with self._write_lock:
+            for item in batch:
+                if isinstance(item, threading.Event):
+                    flush_markers.append(item)
+                    continue
+
+                self._store_crash(item)
+                crash_lines.append(f"CRASH in {item.operation}: {item.error_message}")
+
+        for item in batch:
+            if not isinstance(item, threading.Event):
+                self._log_analysis(item.flags)
+
+        if crash_lines:
+            logger.error("\n".join(crash_lines))
+
+        for marker in flush_markers:
+            marker.set()
+
+    def _store_crash(self, crash_data: CrashRecord):
+        """
+        Append to the ring and the per-operation index, keeping both in step
 
-    def _analyze_crash(self, crash_data: Dict[str, Any], error: Exception):
+        @param {CrashRecord} crash_data - Crash entry to store
+        """
+        evicted = self.crash_log.append(crash_data)
+        if evicted is not None:
+            # Ring is FIFO, so the evicted entry is the oldest for its operation too
+            by_operation = self._crashes_by_operation[evicted.operation]
+            by_operation.popleft()
+            if not by_operation:
+                del self._crashes_by_operation[evicted.operation]
+
+        operation = crash_data.operation
+        by_operation = self._crashes_by_operation.get(operation)
+        if by_operation is None:
+            by_operation = self._crashes_by_operation[operation] = deque()
+        by_operation.append(crash_data)
+
+    def flush(self, timeout: float = 1.0) -> bool:
+        """
+        Wait until every crash reported so far has been processed
+
+        @param {float} timeout - Max seconds to wait
+        @returns {bool} True if the queue was drained in time
+        """
+        if self._drain_thread is None or not self._drain_thread.is_alive():
+            return True
+
+        marker = threading.Event()
+        self._queue.put(marker)
+        return marker.wait(timeout)
+
+    def _analyze_crash(self, error_message: str, request_data: Dict[str, Any]) -> int:
         """
         Analyze crash patterns for debugging insights
 
-        @param {dict} crash_data - Crash information
-        @param {Exception} error - The exception that occurred
+        @param {str} error_message - str() of the exception
+        @param {dict} request_data - Request data that caused the crash
+        @returns {int} CRASH_* flags for the crash
         """
-        error_str = str(error).lower()
+        categories = set()
+        for match in _CRASH_CATEGORY_RE.finditer(error_message):
+            categories.add(match.lastgroup)
+            if len(categories) == 2:
+                break
+
+        flags = 0
 
         # Chrome connection died
-        if any(keyword in error_str for keyword in
-               ['disconnected', 'connection closed', 'websocket', 'connection refused']):
-            crash_data['chrome_died'] = True
-            self.stats['chrome_deaths'] += 1
-            logger.error("🔥 Chrome process appears to be dead!")
+        if 'chrome_died' in categories:
+            flags |= CRASH_CHROME_DIED
 
         # Potential injection attempt
-        request_data = crash_data.get('request_data', {})
         if self._looks_like_injection(request_data):
-            crash_data['potential_injection'] = True
-            self.stats['injection_attempts'] += 1
-            logger.info("💉 Potential injection attempt detected (this is good data!)")
+            flags |= CRASH_POTENTIAL_INJECTION
 
         # Malformed request
-        if any(keyword in error_str for keyword in
-               ['invalid', 'malformed', 'parse error', 'syntax error']):
-            crash_data['malformed_request'] = True
-            self.stats['malformed_requests'] += 1
+        if 'malformed' in categories:
+            flags |= CRASH_MALFORMED_REQUEST
+
+        return flags
+
+    def _count_crash(self, flags: int):
+        """
+        Add one crash to the stats (caller holds _stats_lock)
+
+        @param {int} flags - CRASH_* flags of the crash
+        """
+        stats = self.stats
+        stats['total_crashes'] += 1
+        if flags & CRASH_CHROME_DIED:
+            stats['chrome_deaths'] += 1
+        if flags & CRASH_POTENTIAL_INJECTION:
+            stats['injection_attempts'] += 1
+        if flags & CRASH_MALFORMED_REQUEST:
+            stats['malformed_requests'] += 1
+
+    def _log_analysis(self, flags: int):
+        """
+        Log what the analysis found for one crash
+
+        @param {int} flags - CRASH_* flags of the crash
+        """
+        if flags & CRASH_CHROME_DIED:
+            logger.error("🔥 Chrome process appears to be dead!")
+        if flags & CRASH_POTENTIAL_INJECTION:
+            logger.info("💉 Potential injection attempt detected (this is good data!)")
+        if flags & CRASH_MALFORMED_REQUEST:
             logger.info("🗂️  Malformed request detected (good for fuzzing!)")
 
     def _looks_like_injection(self, request_data: Dict[str, Any]) -> bool:
@@ -113,17 +543,21 @@ class ErrorReporter:
         if not request_data:
             return False
 
-        # Convert all values to strings for analysis
-        all_text = json.dumps(request_data).lower()
-
-        # Common injection patterns (we WANT to test these)
-        injection_patterns = [
-            '<script', 'javascript:', 'alert(', 'document.cookie',
-            'drop table', 'union select', '\'; --', '$(', 'eval(',
-            'system(', 'exec(', 'shell_exec', 'passthru'
-        ]
-
-        return any(pattern in all_text for pattern in injection_patterns)
+        # Walk the payload and scan each string as we reach it - no serialized copy,
+        # and we stop at the first hit
+        stack = [request_data]
+        while stack:
+            value = stack.pop()
+            if isinstance(value, str):
+                if _INJECTION_RE.search(value):
+                    return True
+            elif isinstance(value, dict):
+                stack.extend(value.keys())
+                stack.extend(value.values())
+            elif isinstance(value, (list, tuple)):
+                stack.extend(value)
+
+        return False
 
     def report_success(self, operation: str, context: Optional[Dict[str, Any]] = None):
         """
@@ -132,48 +566,88 @@ class ErrorReporter:
         @param {str} operation - What succeeded
         @param {dict} context - Success context
         """
-        logger.debug(f"✅ SUCCESS: {operation}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("✅ SUCCESS: %s", operation)
 
     def get_crash_summary(self) -> Dict[str, Any]:
         """
         Get summary of recent crashes
 
+        Never waits on the drain thread: stats are current, while crashes
+        reported a moment ago may not be in recent_crashes yet.
+
         @returns {dict} Crash statistics and recent entries
         """
-        recent_crashes = list(self.crash_log)[-10:]  # Last 10 crashes
+        recent_crashes = [crash.to_dict() for crash in self.crash_log.recent(10)]  # Last 10 crashes
+
+        with self._stats_lock:
+            stats = self.stats.copy()
+            stats['suppressed_duplicates'] = self._suppressed_crashes
+            repeated = [(count, signature) for signature, (count, _) in self._signatures.items()
+                        if count > 1]
+
+        repeated.sort(key=lambda item: item[0], reverse=True)
+        repeated_crashes = [
+            {
+                'operation': operation,
+                'error_type': error_type,
+                'error_message': error_message,
+                'count': count
+            }
+            for count, (operation, error_type, error_message) in repeated[:10]
+        ]
 
         return {
-            'stats': self.stats.copy(),
+            'stats': stats,
             'recent_crashes': recent_crashes,
+            'repeated_crashes': repeated_crashes,
             'total_logged': len(self.crash_log),
-            'chrome_health': 'DEAD' if self.stats['chrome_deaths'] > 0 else 'ALIVE'
+            'chrome_health': 'DEAD' if stats['chrome_deaths'] > 0 else 'ALIVE'
         }
 
     def get_crash_by_operation(self, operation: str) -> List[Dict[str, Any]]:
         """
-        Get all crashes for a specific operation
+        Get all crashes for a specific operation (stored so far - never waits
+        on the drain thread)
 
         @param {str} operation - Operation to filter by
         @returns {list} List of crashes for this operation
         """
-        return [crash for crash in self.crash_log if crash['operation'] == operation]
+        crashes = list(self._crashes_by_operation.get(operation, ()))
+        return [crash.to_dict() for crash in crashes]
 
     def clear_crashes(self):
         """
         Clear crash log (for testing or after analysis)
         """
-        self.crash_log.clear()
-        self.stats = {
-            'total_crashes': 0,
-            'chrome_deaths': 0,
-            'injection_attempts': 0,
-            'malformed_requests': 0
-        }
+        with self._write_lock:
+            # Discard crashes still waiting for the drain thread instead of
+            # waiting for them to be stored
+            while True:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if isinstance(item, threading.Event):
+                    item.set()
+
+            self.crash_log.clear()
+            self._crashes_by_operation = {}
+        with self._stats_lock:
+            self.stats = {
+                'total_crashes': 0,
+                'chrome_deaths': 0,
+                'injection_attempts': 0,
+                'malformed_requests': 0
+            }
+            self._signatures = {}
+            self._suppressed_crashes = 0
         logger.info("🗑️  Crash log cleared")
 
 
-# Global error reporter instance
+# Global error reporter instance - the one reporter whose queue is drained at exit
 crash_reporter = ErrorReporter()
+atexit.register(crash_reporter.flush)
 
 
 def handle_crash(operation: str, request_data: Optional[Dict[str, Any]] = None):
@@ -185,6 +659,7 @@ def handle_crash(operation: str, request_data: Optional[Dict[str, Any]] = None):
     @returns {function} Decorator function
     """
     def decorator(func):
+        @wraps(func)
         def wrapper(*args, **kwargs):
             try:
                 result = func(*args, **kwargs)
@@ -199,18 +674,15 @@ def handle_crash(operation: str, request_data: Optional[Dict[str, Any]] = None):
                 )
 
                 # Return the crash data as JSON - this is useful debugging info!
-                from flask import jsonify
-                return jsonify({
+                return Response(_json_dumps({
                     'crash': True,
                     'operation': operation,
                     'error': str(e),
                     'error_type': type(e).__name__,
-                    'timestamp': crash_data['timestamp'],
+                    'timestamp': crash_data.timestamp,
                     'details': 'Check logs for full traceback'
-                }), 500
+                }), status=500, mimetype='application/json')
 
-        wrapper.__name__ = func.__name__
-        wrapper.__doc__ = func.__doc__
         return wrapper
     return decorator
 
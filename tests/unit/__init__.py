@@ -0,0 +1,5 @@
+"""
+CDP Ninja Unit Tests
+
+Offline tests for internals that don't need Chrome or a running bridge.
+"""
@@ -0,0 +1,159 @@
+"""
+Unit Tests for CDPClient message handling
+
+Drives a CDPClient against a scripted in-memory connection, so no Chrome
+instance is needed.
+"""
+
+import json
+import os
+import socket
+import time
+import unittest
+from queue import Queue, Empty
+from threading import Barrier, Event, Thread
+from unittest import mock
+
+from cdp_ninja.core.cdp_client import CDPClient, CDPConnection, CDPEvent
+from cdp_ninja.core.event_manager import EventManager
+
+
+def _frame(message: dict) -> str:
+    return json.dumps(message, separators=(',', ':'))
+
+
+class FakeConnection:
+    """Stands in for CDPConnection: answers every command after a burst of events"""
+
+    def __init__(self, events_before_response: int):
+        self.events_before_response = events_before_response
+        self.connected = Event()
+        self.frames: Queue = Queue()
+        self.host = 'localhost'
+        self.port = 9222
+        self.url = None
+
+    def connect(self) -> bool:
+        self.connected.set()
+        return True
+
+    def disconnect(self):
+        self.connected.clear()
+
+    def close(self):
+        self.disconnect()
+
+    def send(self, message) -> bool:
+        if isinstance(message, bytes):
+            message = message.decode('utf-8')
+        cmd_id = json.loads(message)['id']
+
+        # Chrome emits these events before it answers the command (compact
+        # JSON with "method" first, as Chrome serializes it)
+        for n in range(self.events_before_response):
+            self.frames.put(_frame({"method": "Runtime.consoleAPICalled", "params": {"n": n}}))
+        self.frames.put(_frame({"id": cmd_id, "result": {}}))
+        return True
+
+    def receive(self, timeout: float = 1.0):
+        try:
+            return self.frames.get(timeout=timeout)
+        except Empty:
+            return None
+
+
+class TestCDPClientOrdering(unittest.TestCase):
+    """Events sent before a command response must be stored before send_command returns"""
+
+    def setUp(self):
+        self.event_manager = EventManager(max_events_per_domain=1000, max_total_events=1000)
+        self.event_manager.accepts_domain = lambda domain: True
+        # A slow handler keeps the decoder thread behind the listener
+        self.event_manager.register_event_handler('Runtime.consoleAPICalled',
+                                                  lambda event: time.sleep(0.001))
+
+        patcher = mock.patch('cdp_ninja.core.cdp_client.get_event_manager',
+                             return_value=self.event_manager)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.client = CDPClient(max_events=16, auto_reconnect=False, timeout=5)
+        self.client.connection = FakeConnection(events_before_response=200)
+
+        with mock.patch.object(CDPClient, '_enable_default_domains', return_value=True):
+            self.assertTrue(self.client.start())
+        self.addCleanup(self.client.stop)
+
+    def test_events_before_response_are_stored_first(self):
+        for _ in range(5):
+            self.event_manager.clear_events()
+
+            response = self.client.send_command("Runtime.evaluate", {"expression": "1"})
+
+            self.assertNotIn('error', response)
+            events = self.event_manager.get_recent_events('Runtime', limit=1000)
+            self.assertEqual(len(events), 200)
+
+    def test_backlog_overflow_does_not_drop_events(self):
+        # 200 events through a 16-slot backlog: the listener waits, nothing is lost
+        self.event_manager.clear_events()
+        self.client.send_command("Runtime.evaluate", {"expression": "1"})
+
+        events = self.event_manager.get_recent_events('Runtime', limit=1000)
+        self.assertEqual([event.params['n'] for event in events], list(range(200)))
+
+
+
+class TestCDPEventDecode(unittest.TestCase):
+    """Lazily decoded events must parse once, however many threads read them"""
+
+    def test_concurrent_readers_share_one_params_dict(self):
+        for _ in range(50):
+            event = CDPEvent.from_message('Network.requestWillBeSent', 'Network',
+                                          _frame({"method": "Network.requestWillBeSent",
+                                                  "params": {"requestId": "1"}}))
+            barrier = Barrier(8)
+            seen = []
+
+            def read():
+                barrier.wait()
+                seen.append(event.params)
+
+            threads = [Thread(target=read) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            self.assertTrue(all(params is seen[0] for params in seen))
+            self.assertEqual(seen[0], {"requestId": "1"})
+
+
+
+@unittest.skipUnless(os.path.isdir('/proc/self/fd'), "needs /proc to count file descriptors")
+class TestCDPConnectionTeardown(unittest.TestCase):
+    """Connecting, reconnecting and closing must not leak the wake-up socket pair"""
+
+    def _open_fds(self) -> int:
+        return len(os.listdir('/proc/self/fd'))
+
+    def test_close_releases_wake_sockets(self):
+        peer_a, peer_b = socket.socketpair()
+        self.addCleanup(peer_a.close)
+        self.addCleanup(peer_b.close)
+        fake_ws = mock.MagicMock(sock=peer_a)
+
+        with mock.patch('cdp_ninja.core.cdp_client.websocket.WebSocket', return_value=fake_ws), \
+                mock.patch.object(CDPConnection, 'get_debugger_url', return_value='ws://fake'):
+            before = self._open_fds()
+            for _ in range(3):
+                connection = CDPConnection()
+                self.assertTrue(connection.connect())
+                self.assertTrue(connection.connect())  # Reconnect reuses the pair
+                connection.close()
+
+        self.assertEqual(self._open_fds(), before)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+"""
+Unit Tests for DomainManager
+
+Runs without a CDP client attached, so enabling a domain only updates
+the manager's own bookkeeping.
+"""
+
+import unittest
+from unittest import mock
+
+from cdp_ninja.core.domain_manager import CDPDomain, DomainManager, DomainRiskLevel
+
+
+class TestEnsureDomain(unittest.TestCase):
+    """The lock-free fast path never writes; new callers are recorded under the lock"""
+
+    def test_new_caller_is_recorded_and_bumps_the_status_version(self):
+        manager = DomainManager()
+        self.assertTrue(manager.ensure_domain(CDPDomain.NETWORK, "first"))
+        version = manager._state_version
+
+        self.assertTrue(manager.ensure_domain(CDPDomain.NETWORK, "second"))
+
+        state = manager.domain_states[CDPDomain.NETWORK]
+        self.assertEqual(state.enabled_by, {"first", "second"})
+        self.assertEqual(manager._state_version, version + 1)
+
+    def test_repeat_call_by_known_caller_skips_the_lock(self):
+        manager = DomainManager()
+        manager.ensure_domain(CDPDomain.NETWORK, "first")
+
+        manager._lock = mock.MagicMock()
+        self.assertTrue(manager.ensure_domain(CDPDomain.NETWORK, "first"))
+        manager._lock.__enter__.assert_not_called()
+
+
+class TestCleanupUnusedDomains(unittest.TestCase):
+    """Explicit cleanup calls are never throttled"""
+
+    def test_back_to_back_calls_both_unload_stale_domains(self):
+        manager = DomainManager(max_risk_level=DomainRiskLevel.HIGH)
+
+        for domain in (CDPDomain.MEMORY, CDPDomain.ACCESSIBILITY):
+            self.assertTrue(manager.ensure_domain(domain, "test"))
+            manager.domain_states[domain].last_used = 0  # Long unused
+            self.assertEqual(manager.cleanup_unused_domains(), 1)
+            self.assertFalse(manager.domain_states[domain].enabled)
+
+
+class TestSetRiskLevel(unittest.TestCase):
+    """Changing the risk level invalidates the cached status"""
+
+    def test_status_reflects_the_new_risk_level(self):
+        manager = DomainManager(max_risk_level=DomainRiskLevel.HIGH)
+        self.assertTrue(manager.ensure_domain(CDPDomain.MEMORY, "test"))
+        manager.get_domain_status()  # Prime the cache
+
+        manager.set_risk_level(DomainRiskLevel.SAFE)
+
+        status = manager.get_domain_status()
+        self.assertEqual(status["max_risk_level"], DomainRiskLevel.SAFE.value)
+        self.assertNotIn(CDPDomain.MEMORY.value, status["enabled_domains"])
+        self.assertFalse(status["domain_details"][CDPDomain.MEMORY.value]["can_enable"])
+
+
+if __name__ == '__main__':
+    unittest.main()
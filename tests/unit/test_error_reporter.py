@@ -0,0 +1,173 @@
+"""
+Unit Tests for ErrorReporter
+
+Exercises crash capture, storage and statistics on private ErrorReporter
+instances, so the global crash_reporter is never touched.
+"""
+
+import gc
+import unittest
+import weakref
+from datetime import datetime
+from unittest import mock
+
+from cdp_ninja.utils.error_reporter import (
+    ErrorReporter, CRASH_CHROME_DIED, CRASH_POTENTIAL_INJECTION, _CrashRing, _timestamp
+)
+
+
+class _Payload:
+    """Stand-in for a request object held in a crashing frame's locals"""
+
+
+def _crash(payload_refs: list):
+    payload = _Payload()
+    payload_refs.append(weakref.ref(payload))
+    raise ValueError("boom")
+
+
+class TestCrashTracebacks(unittest.TestCase):
+    """Stored crashes keep their traceback text, not the frames behind it"""
+
+    def test_stored_crash_does_not_keep_frame_locals_alive(self):
+        reporter = ErrorReporter(keep_tracebacks=True)
+        payload_refs = []
+
+        try:
+            _crash(payload_refs)
+        except ValueError as e:
+            crash = reporter.report_crash("test_op", e)
+        reporter.flush()
+        gc.collect()
+
+        self.assertIsNone(payload_refs[0]())
+        text = str(crash.traceback)
+        self.assertIn("in _crash", text)
+        self.assertIn("ValueError: boom", text)
+
+
+
+class TestCrashAnalysis(unittest.TestCase):
+    """Flags and stats are available as soon as report_crash returns"""
+
+    def test_flags_are_set_on_the_returned_record(self):
+        reporter = ErrorReporter()
+
+        crash = reporter.report_crash("navigate", ConnectionError("websocket connection closed"),
+                                      request_data={"url": "javascript:alert(1)"})
+
+        self.assertTrue(crash.flags & CRASH_CHROME_DIED)
+        self.assertTrue(crash.flags & CRASH_POTENTIAL_INJECTION)
+
+    def test_readers_do_not_wait_for_the_drain_thread(self):
+        reporter = ErrorReporter()
+        reporter.report_crash("navigate", ConnectionError("websocket connection closed"))
+
+        with mock.patch.object(reporter, 'flush', side_effect=AssertionError("reader flushed")):
+            summary = reporter.get_crash_summary()
+            reporter.get_crash_by_operation("navigate")
+            reporter.clear_crashes()
+
+        self.assertEqual(summary['stats']['total_crashes'], 1)
+        self.assertEqual(summary['stats']['chrome_deaths'], 1)
+        self.assertEqual(summary['chrome_health'], 'DEAD')
+
+
+
+class TestCrashSampling(unittest.TestCase):
+    """Duplicate sampling is opt-in and never hides crashes from the stats"""
+
+    def _report(self, reporter: ErrorReporter, times: int) -> list:
+        return [reporter.report_crash("navigate", ConnectionError("websocket connection closed"))
+                for _ in range(times)]
+
+    def test_every_crash_is_stored_by_default(self):
+        reporter = ErrorReporter()
+        self._report(reporter, 5)
+        self.assertTrue(reporter.flush())
+
+        self.assertEqual(len(reporter.get_crash_by_operation("navigate")), 5)
+        self.assertEqual(reporter.get_crash_summary()['stats']['suppressed_duplicates'], 0)
+
+    def test_sampled_out_crashes_are_counted_and_resolve_to_a_stored_crash(self):
+        reporter = ErrorReporter(sample_every=4)
+        returned = self._report(reporter, 8)
+        self.assertTrue(reporter.flush())
+
+        stored = reporter.crash_log.snapshot()
+        self.assertEqual(len(stored), 2)
+        for crash in returned:
+            self.assertIn(crash, stored)
+
+        stats = reporter.get_crash_summary()['stats']
+        self.assertEqual(stats['total_crashes'], 8)
+        self.assertEqual(stats['chrome_deaths'], 8)
+        self.assertEqual(stats['suppressed_duplicates'], 6)
+
+
+class _ClearOnHeadRead:
+    """Ring state that clears its ring the moment a reader looks at the head"""
+
+    def __init__(self, ring: _CrashRing):
+        self._ring = ring
+        self._state = ring._state
+        self.slots = self._state.slots
+
+    @property
+    def head(self) -> int:
+        self._ring.clear()
+        return self._state.head
+
+
+class TestCrashRingClear(unittest.TestCase):
+    """A clear() between a reader's head and slot reads never yields empty slots"""
+
+    def _fill(self, ring: _CrashRing, count: int):
+        for n in range(count):
+            ring.append(n)
+        ring._state = _ClearOnHeadRead(ring)
+
+    def test_recent_reads_one_consistent_state(self):
+        ring = _CrashRing(8)
+        self._fill(ring, 12)
+        self.assertEqual(ring.recent(10), list(range(4, 12)))
+
+    def test_snapshot_reads_one_consistent_state(self):
+        ring = _CrashRing(8)
+        self._fill(ring, 5)
+        self.assertEqual(ring.snapshot(), list(range(5)))
+
+    def test_summary_survives_clear_mid_read(self):
+        reporter = ErrorReporter(max_entries=8)
+        for _ in range(12):
+            reporter.report_crash("navigate", ValueError("boom"))
+        self.assertTrue(reporter.flush())
+        reporter.crash_log._state = _ClearOnHeadRead(reporter.crash_log)
+
+        summary = reporter.get_crash_summary()
+
+        self.assertEqual(len(summary['recent_crashes']), 8)
+
+
+class TestTimestamp(unittest.TestCase):
+    """Cached timestamps keep datetime.isoformat()'s microseconds - they double as crash ids"""
+
+    def _timestamp_at(self, now: float) -> str:
+        with mock.patch('cdp_ninja.utils.error_reporter.time.time', return_value=now):
+            return _timestamp()
+
+    def test_crashes_in_the_same_millisecond_get_distinct_ids(self):
+        first = self._timestamp_at(1700000000.5)
+        second = self._timestamp_at(1700000000.5 + 2 ** -18)  # ~4 microseconds later
+
+        self.assertNotEqual(first, second)
+        self.assertEqual(first, datetime.fromtimestamp(1700000000.5).isoformat())
+        self.assertEqual(second, datetime.fromtimestamp(1700000000.5 + 2 ** -18).isoformat())
+
+    def test_whole_seconds_match_isoformat(self):
+        self.assertEqual(self._timestamp_at(1700000001.0),
+                         datetime.fromtimestamp(1700000001.0).isoformat())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,104 @@
+"""
+Unit Tests for local agent installation
+
+Installs throwaway agent files into temporary directories, so the bundled
+agents and the user's Claude setup are never touched.
+"""
+
+import contextlib
+import io
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from cdp_ninja.deployment import cli
+
+
+class InstallAgentsTestCase(unittest.TestCase):
+    """Temporary source/target directories with one pre-existing agent"""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.source = Path(tmp.name) / "agents"
+        self.target = Path(tmp.name) / "installed"
+        self.source.mkdir()
+        self.target.mkdir()
+
+        self.agent_files = []
+        for name in ("alpha.md", "beta.md"):
+            agent_file = self.source / name
+            agent_file.write_text(f"new {name}")
+            self.agent_files.append(agent_file)
+
+        # alpha.md already exists in the target
+        (self.target / "alpha.md").write_text("old alpha.md")
+
+        # 'overwrite all' is remembered on the function between calls
+        patcher = mock.patch.object(cli.install_agents_local, 'overwrite_all', False, create=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def install(self, on_conflict: str, tty: bool, answers=()) -> bool:
+        with mock.patch.object(cli.sys.stdin, 'isatty', return_value=tty), \
+                mock.patch('builtins.input', side_effect=list(answers)) as fake_input, \
+                contextlib.redirect_stdout(io.StringIO()):
+            result = cli.install_agents_local(str(self.target), self.agent_files, on_conflict)
+        self.input_calls = fake_input.call_count
+        return result
+
+    def installed_text(self, name: str) -> str:
+        return (self.target / name).read_text()
+
+
+class TestOnConflict(InstallAgentsTestCase):
+    """--on-conflict decides existing files without asking"""
+
+    def test_overwrite_replaces_existing_files(self):
+        self.assertTrue(self.install('overwrite', tty=True))
+
+        self.assertEqual(self.installed_text("alpha.md"), "new alpha.md")
+        self.assertEqual(self.installed_text("beta.md"), "new beta.md")
+        self.assertEqual(self.input_calls, 0)
+
+    def test_skip_keeps_existing_files(self):
+        self.assertTrue(self.install('skip', tty=True))
+
+        self.assertEqual(self.installed_text("alpha.md"), "old alpha.md")
+        self.assertEqual(self.installed_text("beta.md"), "new beta.md")
+        self.assertEqual(self.input_calls, 0)
+
+    def test_prompt_asks_on_a_terminal(self):
+        self.assertTrue(self.install('prompt', tty=True, answers=["o"]))
+
+        self.assertEqual(self.installed_text("alpha.md"), "new alpha.md")
+        self.assertEqual(self.input_calls, 1)
+
+    def test_handle_install_agents_passes_on_conflict_through(self):
+        with mock.patch.object(cli, '_agents_dir', return_value=self.source), \
+                mock.patch.object(cli, '_agent_files', return_value=tuple(self.agent_files)), \
+                contextlib.redirect_stdout(io.StringIO()):
+            self.assertTrue(cli.handle_install_agents(str(self.target), on_conflict='overwrite'))
+
+        self.assertEqual(self.installed_text("alpha.md"), "new alpha.md")
+
+
+class TestNonInteractive(InstallAgentsTestCase):
+    """Without a terminal, 'prompt' skips conflicts instead of blocking in input()"""
+
+    def test_prompt_skips_existing_files_without_asking(self):
+        self.assertTrue(self.install('prompt', tty=False))
+
+        self.assertEqual(self.installed_text("alpha.md"), "old alpha.md")
+        self.assertEqual(self.installed_text("beta.md"), "new beta.md")
+        self.assertEqual(self.input_calls, 0)
+
+    def test_explicit_overwrite_still_applies(self):
+        self.assertTrue(self.install('overwrite', tty=False))
+
+        self.assertEqual(self.installed_text("alpha.md"), "new alpha.md")
+
+
+if __name__ == '__main__':
+    unittest.main()